@@ -9,119 +9,81 @@ using mock benchmark data to avoid expensive computations.
 import sys
 import os
 
+import numpy as np
+
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.report_generator import ReportGenerator, BenchmarkResult
 
 
-def create_mock_benchmark_results():
-    """Create mock benchmark results to avoid expensive computations."""
-    mock_results = []
-    
-    # Mock Mongolian Tent results
-    mt_sizes = [3, 4, 5, 8, 10]
-    for n in mt_sizes:
-        lower_bound = 8 + (n-3) * 3  # Approximate lower bound
-        
-        # Branch and bound result (optimal for small instances)
-        if n <= 5:
-            k_value = lower_bound
-            success = True
-            exec_time = 0.001 + (n-3) * 0.15  # Slightly slower than backtracking due to overhead
-        else:
-            k_value = None
-            success = False
-            exec_time = 120.0  # Timeout
-        
-        mock_results.append(BenchmarkResult(
-            graph_type="mongolian_tent",
-            graph_params={"n": n},
+def _mock_result_rows(graph_type, graph_params, lower_bound, bnb_success, bnb_time,
+                      fast_k, fast_time, intelligent_k, intelligent_time):
+    """Zip precomputed benchmark columns into BenchmarkResult instances."""
+    columns = zip(graph_params, lower_bound.tolist(), bnb_success.tolist(), bnb_time.tolist(),
+                  fast_k.tolist(), fast_time.tolist(), intelligent_k.tolist(), intelligent_time.tolist())
+    rows = []
+    for params, lb, success, exec_time, f_k, f_time, i_k, i_time in columns:
+        rows.append(BenchmarkResult(
+            graph_type=graph_type,
+            graph_params=params,
             algorithm="branch_and_bound",
-            k_value=k_value,
+            k_value=lb if success else None,
             execution_time=exec_time,
             success=success,
-            lower_bound=lower_bound,
+            lower_bound=lb,
             gap=0 if success else None
         ))
-        
-        # Heuristic fast result
-        fast_k = lower_bound + 2 + (n-3) // 2
-        mock_results.append(BenchmarkResult(
-            graph_type="mongolian_tent",
-            graph_params={"n": n},
+        rows.append(BenchmarkResult(
+            graph_type=graph_type,
+            graph_params=params,
             algorithm="heuristic_fast",
-            k_value=fast_k,
-            execution_time=0.005 + n * 0.01,  # Very fast
+            k_value=f_k,
+            execution_time=f_time,
             success=True,
-            lower_bound=lower_bound,
-            gap=fast_k - lower_bound
+            lower_bound=lb,
+            gap=f_k - lb
         ))
-        
-        # Heuristic intelligent result
-        intelligent_k = lower_bound + 1 + (n-3) // 3
-        mock_results.append(BenchmarkResult(
-            graph_type="mongolian_tent",
-            graph_params={"n": n},
+        rows.append(BenchmarkResult(
+            graph_type=graph_type,
+            graph_params=params,
             algorithm="heuristic_intelligent",
-            k_value=intelligent_k,
-            execution_time=0.01 + n * 0.03,  # Slower than fast but better quality
+            k_value=i_k,
+            execution_time=i_time,
             success=True,
-            lower_bound=lower_bound,
-            gap=intelligent_k - lower_bound
+            lower_bound=lb,
+            gap=i_k - lb
         ))
+    return rows
+
+
+def create_mock_benchmark_results():
+    """Create mock benchmark results to avoid expensive computations."""
+    mock_results = []
+    
+    # Mock Mongolian Tent results
+    n = np.array([3, 4, 5, 8, 10])
+    lower_bound = 8 + (n - 3) * 3  # Approximate lower bound
+    # Branch and bound is optimal for small instances and times out otherwise
+    bnb_success = n <= 5
+    bnb_time = np.where(bnb_success, 0.001 + (n - 3) * 0.15, 120.0)
+    mock_results.extend(_mock_result_rows(
+        "mongolian_tent", [{"n": int(size)} for size in n], lower_bound, bnb_success, bnb_time,
+        fast_k=lower_bound + 2 + (n - 3) // 2, fast_time=0.005 + n * 0.01,
+        intelligent_k=lower_bound + 1 + (n - 3) // 3, intelligent_time=0.01 + n * 0.03
+    ))
     
     # Mock Circulant results
-    circulant_params = [(6, 2), (8, 3), (10, 5), (12, 5)]
-    for n, r in circulant_params:
-        lower_bound = max(4, n // 2 + r)  # Approximate lower bound
-        
-        # Branch and bound result
-        if n <= 8:
-            k_value = lower_bound
-            success = True
-            exec_time = 0.001 + n * 0.015  # Slightly slower than backtracking
-        else:
-            k_value = None
-            success = False
-            exec_time = 120.0
-        
-        mock_results.append(BenchmarkResult(
-            graph_type="circulant",
-            graph_params={"n": n, "r": r},
-            algorithm="branch_and_bound",
-            k_value=k_value,
-            execution_time=exec_time,
-            success=success,
-            lower_bound=lower_bound,
-            gap=0 if success else None
-        ))
-        
-        # Heuristic fast result
-        fast_k = lower_bound + 2 + (n-6) // 3
-        mock_results.append(BenchmarkResult(
-            graph_type="circulant",
-            graph_params={"n": n, "r": r},
-            algorithm="heuristic_fast",
-            k_value=fast_k,
-            execution_time=0.001 + n * 0.005,  # Very fast
-            success=True,
-            lower_bound=lower_bound,
-            gap=fast_k - lower_bound
-        ))
-        
-        # Heuristic intelligent result
-        intelligent_k = lower_bound + 1 + (n-6) // 4
-        mock_results.append(BenchmarkResult(
-            graph_type="circulant",
-            graph_params={"n": n, "r": r},
-            algorithm="heuristic_intelligent",
-            k_value=intelligent_k,
-            execution_time=0.002 + n * 0.02,  # Slower than fast but better quality
-            success=True,
-            lower_bound=lower_bound,
-            gap=intelligent_k - lower_bound
-        ))
+    circulant_params = np.array([(6, 2), (8, 3), (10, 5), (12, 5)])
+    n, r = circulant_params[:, 0], circulant_params[:, 1]
+    lower_bound = np.maximum(4, n // 2 + r)  # Approximate lower bound
+    bnb_success = n <= 8
+    bnb_time = np.where(bnb_success, 0.001 + n * 0.015, 120.0)
+    mock_results.extend(_mock_result_rows(
+        "circulant", [{"n": int(a), "r": int(b)} for a, b in circulant_params], lower_bound, bnb_success, bnb_time,
+        fast_k=lower_bound + 2 + (n - 6) // 3, fast_time=0.001 + n * 0.005,
+        intelligent_k=lower_bound + 1 + (n - 6) // 4, intelligent_time=0.002 + n * 0.02
+    ))
     
     return mock_results
 
@@ -149,12 +111,11 @@ def main():
         if output_results['generation_successful']:
             print("\n✓ Report generation completed successfully!")
             
-            # Count images in the generated report
-            with open("k_labeling_algorithms_report.md", 'r', encoding='utf-8') as f:
-                content = f.read()
-                image_count = content.count("![")
-                
+            image_count = output_results['image_count']
             print(f"✓ Report includes {image_count} integrated images")
+            cache_stats = generator.image_cache_stats
+            print(f"✓ Image cache: {cache_stats['unique_images']} unique images, "
+                  f"{cache_stats['hit_ratio']:.1%} hit ratio")
             print(f"✓ Main report: {output_results['main_report_file']}")
             print(f"✓ Validation report: {output_results['validation_report_file']}")
             print(f"✓ Summary: {output_results['summary_file']}")
@@ -0,0 +1,310 @@
+"""
+Command-line helpers behind main.py.
+
+Graph construction, animation wiring, solver dispatch, visualization and JSON
+output are shared by the Mongolian Tent and circulant runs; main() only
+strings them together.
+
+References:
+    - ai-docs/initial-design/master_plan.md (overall project architecture)
+    - ai-docs/enhancements/18_json_graph_output.md (JSON output format)
+"""
+import argparse
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.constants import DEFAULT_TENT_SIZE, DEFAULT_SOLVER_TYPE, DEFAULT_CIRCULANT_OFFSET, DEFAULT_GRAPH_TYPE, DEFAULT_HEURISTIC_MODE
+from src.csr_graph import build_csr, csr_metrics, csr_edges
+from src.graph_generator import create_mongolian_tent_graph, create_mongolian_tent_graph_csr, generate_circulant_graph
+from src.graph_properties import calculate_circulant_lower_bound, calculate_lower_bound, compute_diameter_persistent
+from src.json_output import write_graph_json
+from src.labeling_solver import find_feasible_k_labeling, find_optimal_k_labeling, find_optimal_k_labeling_circulant, dsatur_order
+
+
+@dataclass(slots=True, frozen=True)
+class SolveResult:
+    """Outcome of one solver run, as printed and written by main()."""
+    k: Optional[int]
+    labeling: Optional[Dict[Any, int]]
+    lower_bound: Any
+    gap: Any
+    solver_name: str
+    file_name: str
+    time_taken: float
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser of main.py."""
+    parser = argparse.ArgumentParser(description="Find and visualize k-labeling for Mongolian Tent graphs.")
+    parser.add_argument("--n", type=int, default=DEFAULT_TENT_SIZE, help=f"Value of n (default: {DEFAULT_TENT_SIZE})")
+    parser.add_argument("--graph-type", type=str, default=DEFAULT_GRAPH_TYPE, choices=["mongolian_tent", "circulant"], help="Graph type: 'mongolian_tent' or 'circulant' (r = max(n - DEFAULT_CIRCULANT_OFFSET, 2))")
+    parser.add_argument("--solver", type=str, default=DEFAULT_SOLVER_TYPE, choices=["heuristic", "backtracking", "edge-irregular", "branch-and-bound"], help=f"Solver to use: 'heuristic', 'backtracking', 'edge-irregular', or 'branch-and-bound' (default: {DEFAULT_SOLVER_TYPE})")
+    parser.add_argument("--k-limit", type=int, default=None, help="Upper bound on k for edge-irregular solver")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for the edge-irregular k scan (several k limits at once), the exact diameter BFS and the intelligent heuristic's greedy attempts (default: 1)")
+    parser.add_argument("--progress", action="store_true", help="Print progress of k-limit search for edge-irregular solver")
+    parser.add_argument("--heuristic_mode", type=str, default=DEFAULT_HEURISTIC_MODE, choices=["accurate", "fast", "intelligent"], help="Heuristic mode: 'accurate' uses randomized multi-attempt search (slower, better chance of optimal k), 'fast' uses a single-pass greedy (faster, possibly higher k), 'intelligent' uses a degree-biased and conflict-minimizing approach. Ignored for backtracking solver.")
+    parser.add_argument(
+        "--animate",
+        type=str,
+        default="off",
+        choices=["off", "live", "record"],
+        help="Enable animated visualization (live window or record to GIF/MP4).",
+    )
+    parser.add_argument(
+        "--output-json",
+        action="store_true",
+        help="Output graph data and labeling results to a JSON file.",
+    )
+    parser.add_argument(
+        "--exact-diameter",
+        action="store_true",
+        help="Compute the exact diameter with one BFS per vertex instead of the double-sweep estimate.",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Do not print the graph summary (vertices, edges, degree, diameter).",
+    )
+    parser.add_argument(
+        "--include-diameter",
+        action="store_true",
+        help="Add the graph diameter to the JSON output (computed only when requested or printed).",
+    )
+    return parser
+
+
+def build_graph(args: argparse.Namespace) -> Tuple[Dict[Any, List[Any]], int, Optional[int]]:
+    """Generate the selected graph; returns (adjacency list, n, r) with r None for tents."""
+    n = args.n
+    if args.graph_type == "circulant":
+        # Degree r defaults to n - DEFAULT_CIRCULANT_OFFSET, minimum 2
+        r = max(n - DEFAULT_CIRCULANT_OFFSET, 2)
+        return generate_circulant_graph(n, r), n, r
+    # 'mongolian_tent' refers to Mongolian Tent graph
+    n = n if n is not None else DEFAULT_TENT_SIZE
+    return create_mongolian_tent_graph(n), n, None
+
+
+def graph_csr(args: argparse.Namespace, graph_dict: Dict[Any, List[Any]], n: int):
+    """CSR form ``(vertices, indptr, indices)`` of the generated graph.
+
+    Tents are laid out by index arithmetic rather than by walking the dict.
+    """
+    if args.graph_type == "circulant":
+        return build_csr(graph_dict)
+    indptr, indices, vertices = create_mongolian_tent_graph_csr(n)
+    return vertices, indptr, indices
+
+
+def graph_summary(args: argparse.Namespace, graph_dict: Dict[Any, List[Any]], csr, n: int, r: Optional[int]) -> Dict[str, Any]:
+    """
+    Graph properties for the JSON header, printing the circulant banner.
+
+    Properties are only computed when printed or written to JSON; scripted
+    (--output-json / --quiet) runs skip the summary banner.
+    """
+    print_summary = args.graph_type == "circulant" and not (args.output_json or args.quiet)
+    graph_info: Dict[str, Any] = {}
+    if print_summary or args.output_json:
+        edges, max_deg = csr_metrics(csr[1])
+        graph_info = {"vertex_count": len(csr[0]), "edge_count": edges}
+    if print_summary or (args.output_json and args.include_diameter):
+        graph_info["diameter"] = compute_diameter_persistent(graph_dict, exact=args.exact_diameter, max_workers=args.workers)
+    if print_summary:
+        print(f"Circulant graph C_{{{n},{r}}}: vertices={len(csr[0])}, edges={edges}, degree={max_deg}, diameter={graph_info['diameter']}")
+    return graph_info
+
+
+def setup_animation(args: argparse.Namespace, graph_dict: Dict[Any, List[Any]]) -> Tuple[Optional[Callable], Optional[Callable], Optional[Sequence]]:
+    """Return (on_step, on_event, recorded events) for the --animate mode."""
+    if args.animate == "live":
+        from src.visualization.animation import AnimationController
+
+        anim_ctrl = AnimationController(graph_dict, mode="live")
+        return anim_ctrl.update, None, None
+    if args.animate == "record":
+        from src.events import EventLog
+        from src.visualization.recorder import EventRecorder
+
+        # Columnar log: a long solve does not keep one object per event alive
+        events = EventLog()
+        return None, EventRecorder(events), events
+    return None, None, None
+
+
+def _run_circulant_solver(args, n: int, r: int, on_step, on_event, vertex_order) -> SolveResult:
+    solver_type = args.solver
+    heuristic_mode = args.heuristic_mode
+    start_time = time.time()
+    if solver_type == "heuristic":
+        k, labeling = find_feasible_k_labeling(
+            "circulant",
+            {"n": n, "r": r},
+            algorithm=heuristic_mode,
+            on_step=on_step,
+            on_event=on_event,
+            vertex_order=vertex_order,
+            max_workers=args.workers,
+        )
+        time_taken = time.time() - start_time
+        lower_bound = calculate_circulant_lower_bound(n, r)
+        gap = (k - lower_bound) if isinstance(k, int) else "N/A"
+        return SolveResult(k, labeling, lower_bound, gap, f"Heuristic ({heuristic_mode})",
+                           f"graphs/circulant_{n}_{r}_{solver_type}_{heuristic_mode}_k_labeled.png", time_taken)
+    k, labeling = find_optimal_k_labeling_circulant(n, r, on_step=on_step, on_event=on_event)
+    time_taken = time.time() - start_time
+    # Optimal solver finds minimal k
+    return SolveResult(k, labeling, k, 0, "Optimal Circulant Solver", f"graphs/circulant_{n}_{r}_k_labeled.png", time_taken)
+
+
+def _run_tent_solver(args, graph_dict, n: int, on_step, on_event, vertex_order) -> Optional[SolveResult]:
+    solver_type = args.solver
+    heuristic_mode = args.heuristic_mode
+    if solver_type in ("edge-irregular", "branch-and-bound"):
+        # Load the compiled backtracking kernel before the timed solve
+        import src.edge_irregular_solver  # noqa: F401
+    start_time = time.time()
+    if solver_type == "heuristic":
+        k, labeling = find_feasible_k_labeling(
+            args.graph_type,
+            {"n": n},
+            algorithm=heuristic_mode,
+            on_step=on_step,
+            on_event=on_event,
+            vertex_order=vertex_order,
+            max_workers=args.workers,
+        )
+        lower_bound = calculate_lower_bound(n)
+        gap = (k - lower_bound) if isinstance(k, int) else "N/A"
+        solver_name = "Heuristic"
+    elif solver_type == "backtracking":
+        k, labeling = find_optimal_k_labeling(
+            args.graph_type,
+            {"n": n},
+            on_step=on_step,
+            on_event=on_event,
+        )
+        lower_bound = k  # Optimal solver finds minimal k
+        gap = 0
+        solver_name = "Backtracking"
+    elif solver_type == "edge-irregular":
+        # Edge-Irregular backtracking solver (imported here: it pulls in numba)
+        from src.edge_irregular_solver import edge_irregular_lower_bound, k_labeling_backtracking
+        # The bound seeds the k scan and is reported as the gap reference
+        lower_bound = edge_irregular_lower_bound(graph_dict)
+        labeling = k_labeling_backtracking(graph_dict, k_limit=args.k_limit, lower_bound=lower_bound,
+                                           max_workers=args.workers)
+        k = max(labeling.values()) if labeling else None
+        gap = k - lower_bound if isinstance(k, int) else "N/A"
+        solver_name = "Edge-Irregular Backtracking"
+    elif solver_type == "branch-and-bound":
+        from src.labeling_solver import BranchAndBoundSolver
+        solver = BranchAndBoundSolver(n, on_step=on_step)
+        k, labeling = solver.find_es()
+        lower_bound = k  # Branch and Bound finds the optimal k
+        gap = 0
+        solver_name = "Branch and Bound"
+    else:
+        print("Invalid solver type. Please choose 'heuristic', 'backtracking', 'edge-irregular', or 'branch-and-bound'.")
+        return None
+    time_taken = time.time() - start_time
+
+    if solver_type == "heuristic":
+        file_name = f"graphs/mt3_{n}_{solver_type}_{heuristic_mode}.png"
+        solver_name = f"{solver_name} ({heuristic_mode})"
+    else:
+        file_name = f"graphs/mt3_{n}_{solver_type}.png"
+    return SolveResult(k, labeling, lower_bound, gap, solver_name, file_name, time_taken)
+
+
+def run_solver(args: argparse.Namespace, graph_dict: Dict[Any, List[Any]], n: int, r: Optional[int],
+               on_step=None, on_event=None) -> Optional[SolveResult]:
+    """Run the solver selected by ``args`` and time it; None for an unknown solver."""
+    # The intelligent heuristic walks a DSatur order that only depends on the graph structure
+    vertex_order = dsatur_order(graph_dict) if args.solver == "heuristic" and args.heuristic_mode == "intelligent" else None
+    if args.graph_type == "circulant":
+        return _run_circulant_solver(args, n, r, on_step, on_event, vertex_order)
+    return _run_tent_solver(args, graph_dict, n, on_step, on_event, vertex_order)
+
+
+def print_result(result: SolveResult) -> None:
+    """Print k, the lower bound, the gap and the solve time."""
+    print(f"\n{result.solver_name} k found: {result.k}")
+    print(f"Theoretical lower bound for k: {result.lower_bound}")
+    print(f"Gap to lower bound: {result.gap}")
+    print(f"Time taken to find k: {result.time_taken:.2f} seconds")
+
+
+def emit_visualization(graph_dict: Dict[Any, List[Any]], result: SolveResult, shaped: bool) -> None:
+    """Render the labeled graph to ``result.file_name`` (skipped without graphviz)."""
+    try:
+        import networkx as nx
+        from src.visualization import visualize_k_labeling
+
+        visualize_k_labeling(
+            nx.from_dict_of_lists(graph_dict),
+            result.labeling,
+            output=result.file_name,
+            shaped=shaped,
+            heuristic_k=result.k,
+            lower_bound_k=result.lower_bound,
+            gap=result.gap,
+            time_taken=result.time_taken,
+            solver_name=result.solver_name,
+        )
+        print(f"Visualization saved to {result.file_name}")
+    except ImportError:
+        print("Graphviz not installed; skipping visualization.")
+
+
+def save_recording(graph_dict: Dict[Any, List[Any]], events: Optional[Sequence], n: int, solver_type: str) -> None:
+    """Replay recorded solver events into a GIF under graphs/."""
+    from src.visualization.replay import ReplayController
+
+    # Use empty list if events is unexpectedly None
+    replayer = ReplayController(graph_dict, events or [])
+    outfile = f"graphs/solver_run_n{n}_{solver_type}.gif"
+    try:
+        path = replayer.save(outfile)
+        print(f"Recording saved to {path}")
+    except Exception as err:
+        print(f"Failed to save recording: {err}")
+
+
+def _iter_vertex_records(csr, labeling):
+    """Yield one JSON record per vertex, including its label when available."""
+    vertices, _indptr, _indices = csr
+    for node in vertices:
+        node_data = {"id": node, "label": f"v{node}"}
+        if labeling:
+            node_data["k_label"] = labeling.get(node)
+        yield node_data
+
+
+def _iter_edge_records(csr, labeling):
+    """Yield one JSON record per edge, including its weight when available."""
+    for u, v in csr_edges(*csr):
+        edge_data = {"source": u, "target": v}
+        if labeling:
+            edge_data["weight"] = labeling.get(u, 0) + labeling.get(v, 0)
+        yield edge_data
+
+
+def emit_json_output(csr, result: SolveResult, graph_type: str, n: int, r: Optional[int], graph_info: Dict[str, Any]) -> None:
+    """Write the result header plus vertex/edge records next to the figure as JSON."""
+    meta: Dict[str, Any] = {"graph_type": graph_type, "n": n}
+    if r is not None:
+        meta["r"] = r
+    meta.update(graph_info)
+    meta.update({
+        "k_value": result.k,
+        "lower_bound": result.lower_bound,
+        "gap": result.gap,
+        "time_taken_seconds": result.time_taken,
+        "solver_name": result.solver_name,
+    })
+    json_file_name = os.path.splitext(result.file_name)[0] + ".json"
+    write_graph_json(json_file_name, meta, _iter_vertex_records(csr, result.labeling), _iter_edge_records(csr, result.labeling))
+    print(f"JSON output saved to {json_file_name}")
@@ -4,4 +4,10 @@ DEFAULT_GRAPH_TYPE = "mongolian_tent"
 DEFAULT_HEURISTIC_MODE = "intelligent"
 MAX_K_MULTIPLIER_DEFAULT = 20
 GREEDY_ATTEMPTS_DEFAULT = 100 
-DEFAULT_CIRCULANT_OFFSET = 5 
\ No newline at end of file
+DEFAULT_CIRCULANT_OFFSET = 5
+DIAMETER_CACHE_DIR = ".cache/diameter"
+PRIMAL_HEURISTIC_ATTEMPTS = 20
+PRIMAL_HEURISTIC_K_SLACK = 3
+PARALLEL_K_MIN_WINDOW = 4
+PARALLEL_BFS_MIN_VERTICES = 512
+PARALLEL_GREEDY_MIN_ATTEMPTS = 8
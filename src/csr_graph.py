@@ -0,0 +1,210 @@
+"""
+Compressed sparse row (CSR) representation of adjacency-list graphs.
+
+Vertices are renumbered 0..V-1 in adjacency-list order; the neighbors of
+vertex i are ``indices[indptr[i]:indptr[i + 1]]``. Metrics and BFS run on the
+contiguous int32 arrays instead of walking dict-of-list or networkx graphs.
+
+References:
+    - ai-docs/enhancments/enhancement02_shape_graph.md (diameter computation motivation)
+"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from src.constants import PARALLEL_BFS_MIN_VERTICES
+
+
+def build_csr(graph_dict: Dict[Any, List[Any]]) -> Tuple[List[Any], np.ndarray, np.ndarray]:
+    """
+    Convert an adjacency list into CSR arrays.
+
+    Returns:
+        (vertices, indptr, indices) where ``vertices[i]`` is the original id of
+        vertex i, ``indptr`` is int32[V+1] and ``indices`` is int32[2E].
+    """
+    vertices = list(graph_dict)
+    position = {v: i for i, v in enumerate(vertices)}
+    indptr = np.zeros(len(vertices) + 1, dtype=np.int32)
+    np.cumsum([len(graph_dict[v]) for v in vertices], out=indptr[1:])
+    indices = np.fromiter(
+        (position[u] for v in vertices for u in graph_dict[v]), dtype=np.int32, count=int(indptr[-1])
+    )
+    return vertices, indptr, indices
+
+
+def csr_metrics(indptr: np.ndarray) -> Tuple[int, int]:
+    """Return (edge_count, max_degree) of an undirected CSR graph."""
+    if len(indptr) <= 1:
+        return 0, 0
+    degrees = np.diff(indptr)
+    return int(indptr[-1]) // 2, int(degrees.max())
+
+
+def csr_edges(vertices: List[Any], indptr: np.ndarray, indices: np.ndarray) -> Iterator[Tuple[Any, Any]]:
+    """Yield each undirected edge once as (u, v), from the endpoint listed first."""
+    for i in range(len(vertices)):
+        for j in indices[indptr[i]:indptr[i + 1]].tolist():
+            if j > i:
+                yield vertices[i], vertices[j]
+
+
+def _bfs_eccentricity(ptr: List[int], idx: List[int], source: int) -> Tuple[int, int]:
+    """
+    Level-by-level BFS over flat CSR lists; returns (depth, a farthest vertex).
+
+    Among the vertices of the last level the one of smallest degree is reported,
+    which steers double-sweep toward graph "corners" (e.g. the bottom row ends
+    of a Mongolian Tent).
+    """
+    dist = [-1] * (len(ptr) - 1)
+    dist[source] = 0
+    frontier = [source]
+    depth = 0
+    last_level = frontier
+    while frontier:
+        next_frontier = []
+        for u in frontier:
+            for j in range(ptr[u], ptr[u + 1]):
+                w = idx[j]
+                if dist[w] < 0:
+                    dist[w] = depth + 1
+                    next_frontier.append(w)
+        if next_frontier:
+            depth += 1
+            last_level = next_frontier
+        frontier = next_frontier
+    return depth, min(last_level, key=lambda w: ptr[w + 1] - ptr[w])
+
+
+def csr_eccentricity(indptr: np.ndarray, indices: np.ndarray, source: int) -> Tuple[int, int]:
+    """
+    BFS from ``source``.
+
+    Returns (eccentricity, farthest_vertex) over the vertices reachable from
+    ``source``. The arrays are walked as flat Python lists, which beats both
+    dict lookups and per-level NumPy calls at the graph sizes used here.
+    """
+    return _bfs_eccentricity(indptr.tolist(), indices.tolist(), source)
+
+
+def _bfs_distances(ptr: List[int], idx: List[int], source: int) -> List[int]:
+    """BFS distances from ``source`` over flat CSR lists; -1 marks unreachable vertices."""
+    dist = [-1] * (len(ptr) - 1)
+    dist[source] = 0
+    frontier = [source]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for u in frontier:
+            for j in range(ptr[u], ptr[u + 1]):
+                w = idx[j]
+                if dist[w] < 0:
+                    dist[w] = depth
+                    next_frontier.append(w)
+        frontier = next_frontier
+    return dist
+
+
+def _max_eccentricity(ptr: List[int], idx: List[int], sources: Iterable[int]) -> int:
+    """Largest eccentricity among ``sources`` (0 when there are none)."""
+    return max((_bfs_eccentricity(ptr, idx, source)[0] for source in sources), default=0)
+
+
+def _fringe_eccentricity(ptr: List[int], idx: List[int], fringe: List[int], executor, max_workers: int) -> int:
+    """Largest eccentricity in one BFS level, split over the pool for large levels."""
+    if executor is None or len(fringe) < PARALLEL_BFS_MIN_VERTICES:
+        return _max_eccentricity(ptr, idx, fringe)
+    chunks = [fringe[first::max_workers] for first in range(max_workers)]
+    return max(executor.map(_max_eccentricity, repeat(ptr), repeat(idx), chunks))
+
+
+def _component_diameter(ptr: List[int], idx: List[int], start: int, executor, max_workers: int) -> Tuple[int, List[int]]:
+    """
+    iFUB diameter of the component of ``start``; returns (diameter, component).
+
+    A double sweep a -> b gives a lower bound; the root is whichever of the
+    midpoint of a shortest a-b path and the highest-degree vertex has the
+    smaller eccentricity (the hub wins on tent-like graphs). Fringe levels of the root BFS are then evaluated from
+    the deepest up: after level i, any pair not involving a fringe vertex
+    already seen lies within 2 * (i - 1), so the search stops as soon as the
+    best eccentricity reaches that bound.
+    """
+    dist_start = _bfs_distances(ptr, idx, start)
+    component = [v for v, d in enumerate(dist_start) if d >= 0]
+    a = max(component, key=dist_start.__getitem__)
+    dist_a = _bfs_distances(ptr, idx, a)
+    b = max(component, key=dist_a.__getitem__)
+    lower = dist_a[b]
+    dist_b = _bfs_distances(ptr, idx, b)
+    half = lower // 2
+    midpoint = next(v for v in component if dist_a[v] == half and dist_b[v] == lower - half)
+    hub = max(component, key=lambda v: ptr[v + 1] - ptr[v])
+    dist_root = min(
+        (_bfs_distances(ptr, idx, root) for root in {midpoint, hub}),
+        key=max,
+    )
+    levels: List[List[int]] = [[] for _ in range(max(dist_root[v] for v in component) + 1)]
+    for v in component:
+        levels[dist_root[v]].append(v)
+    level = len(levels) - 1
+    lower = max(lower, level)
+    upper = 2 * level
+    while lower < upper:
+        lower = max(lower, _fringe_eccentricity(ptr, idx, levels[level], executor, max_workers))
+        level -= 1
+        upper = 2 * level
+    return lower, component
+
+
+def csr_diameter(indptr: np.ndarray, indices: np.ndarray, max_workers: int = 1) -> int:
+    """
+    Exact diameter (largest finite eccentricity), by iFUB on each component.
+
+    Sparse graphs typically settle in a handful of BFS passes instead of one
+    per vertex; the worst case is still one BFS per vertex. With
+    ``max_workers > 1`` on graphs of at least PARALLEL_BFS_MIN_VERTICES
+    vertices, fringe levels of that size are split into strided chunks run in
+    worker processes.
+    """
+    ptr = indptr.tolist()
+    idx = indices.tolist()
+    n_vertices = len(ptr) - 1
+    parallel = max_workers > 1 and n_vertices >= PARALLEL_BFS_MIN_VERTICES
+    executor = ProcessPoolExecutor(max_workers=max_workers) if parallel else None
+    seen = [False] * n_vertices
+    diameter = 0
+    try:
+        for start in range(n_vertices):
+            if seen[start]:
+                continue
+            component_diameter, component = _component_diameter(ptr, idx, start, executor, max_workers)
+            for v in component:
+                seen[v] = True
+            diameter = max(diameter, component_diameter)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return diameter
+
+
+def csr_double_sweep(indptr: np.ndarray, indices: np.ndarray) -> int:
+    """
+    Double-sweep diameter lower bound in two BFS passes.
+
+    BFS from a minimum-degree non-isolated vertex to a farthest vertex u, then
+    BFS from u; the eccentricity of u never exceeds the diameter and matches it
+    on the Mongolian Tent family. On a disconnected graph only the component
+    of the start vertex is swept, so the estimate may be lower.
+    """
+    ptr = indptr.tolist()
+    idx = indices.tolist()
+    connected = [w for w in range(len(ptr) - 1) if ptr[w + 1] > ptr[w]]
+    if not connected:
+        return 0
+    start = min(connected, key=lambda w: ptr[w + 1] - ptr[w])
+    _depth, u = _bfs_eccentricity(ptr, idx, start)
+    return _bfs_eccentricity(ptr, idx, u)[0]
@@ -1,68 +1,343 @@
-from typing import Any, Dict, List, Optional, Set
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.constants import PARALLEL_K_MIN_WINDOW
+from src.csr_graph import build_csr
+from src.graph_properties import calculate_graph_metrics_from_adjacency, chromatic_lb
 from src.labeling_solver import is_labeling_valid
 
+try:
+    from numba import njit  # type: ignore
+    _NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover – fallback when dependency not installed
+    njit = None  # type: ignore
+    _NUMBA_AVAILABLE = False
+
+
+def _labeled_edge_weights(indptr: np.ndarray, indices: np.ndarray, label_arr: np.ndarray) -> np.ndarray:
+    """
+    Weights of the edges whose endpoints are both labeled (label > 0).
+
+    Each undirected edge is taken once, from its lower-numbered endpoint, by
+    a vectorized gather of the endpoint labels.
+    """
+    src = np.repeat(np.arange(len(indptr) - 1, dtype=np.int32), np.diff(indptr))
+    keep = src < indices
+    src_labels = label_arr[src[keep]]
+    dst_labels = label_arr[indices[keep]]
+    both = (src_labels > 0) & (dst_labels > 0)
+    return src_labels[both] + dst_labels[both]
+
+
+def compute_used_weights(graph: Dict[Any, List[Any]], labels: Dict[Any, int],
+                         csr: Optional[Tuple[List[Any], np.ndarray, np.ndarray]] = None) -> bytearray:
+    """
+    Dense map of the edge weights (sum of labels) over all labeled edges.
+
+    ``used[w]`` is 1 when some labeled edge has weight w; the map has length
+    ``2 * max_label + 1``, so membership is a plain index instead of a hash.
+    Pass the graph's ``build_csr`` result as ``csr`` to skip rebuilding it;
+    the edge walk itself is a NumPy gather over the CSR arrays.
+    """
+    vertices, indptr, indices = build_csr(graph) if csr is None else csr
+    label_arr = np.fromiter((labels.get(v, 0) for v in vertices), dtype=np.int64, count=len(vertices))
+    used = np.zeros(2 * max(labels.values(), default=0) + 1, dtype=np.uint8)
+    used[_labeled_edge_weights(indptr, indices, label_arr)] = 1
+    return bytearray(used)
+
+
+def _predecessor_csr(indptr: np.ndarray, indices: np.ndarray, rank: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Restrict a CSR adjacency to earlier-ranked neighbors, re-indexed by rank.
+
+    Row i of the result belongs to the vertex of rank i and lists the ranks of
+    its neighbors with a smaller rank, in adjacency-list order.
+    """
+    n_vertices = len(indptr) - 1
+    rows = np.repeat(rank, np.diff(indptr))
+    neighbor_ranks = rank[indices]
+    keep = neighbor_ranks < rows
+    rows = rows[keep]
+    by_row = np.argsort(rows, kind="stable")
+    pred_idx = neighbor_ranks[keep][by_row].astype(np.int32)
+    pred_ptr = np.zeros(n_vertices + 1, dtype=np.int32)
+    np.cumsum(np.bincount(rows, minlength=n_vertices), out=pred_ptr[1:])
+    return pred_ptr, pred_idx
+
+
+def _build_predecessor_csr(graph: Dict[Any, List[Any]], ordering: List[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build CSR arrays of already-ordered neighbors for each position in ``ordering``.
+
+    ``pred_idx[pred_ptr[i]:pred_ptr[i + 1]]`` lists the positions j < i adjacent
+    to ``ordering[i]`` – exactly the neighbors labeled before vertex i.
+    """
+    vertices, indptr, indices = build_csr(graph)
+    position = {node: i for i, node in enumerate(ordering)}
+    rank = np.fromiter((position[v] for v in vertices), dtype=np.int32, count=len(vertices))
+    return _predecessor_csr(indptr, indices, rank)
+
+
+def _saturation_order(indptr: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """
+    DSATUR-style vertex order: repeatedly take the unplaced vertex with the most
+    already-placed neighbors, breaking ties by degree, then by vertex index.
+
+    The backtracking labels positions in a fixed order, so the vertices labeled
+    at depth i are always the first i of this order; choosing them up front is
+    equivalent to picking the most-constrained vertex dynamically at each step.
+    """
+    n_vertices = len(indptr) - 1
+    degree = np.diff(indptr).astype(np.int64)
+    scale = int(degree.max()) + 1 if n_vertices else 1
+    # Unplaced vertices score saturation * scale + degree; placed ones score -1
+    score = degree.copy()
+    order = np.empty(n_vertices, dtype=np.int64)
+    for i in range(n_vertices):
+        v = int(np.argmax(score))
+        order[i] = v
+        score[v] = -1
+        neighbors = indices[indptr[v]:indptr[v + 1]]
+        score[neighbors[score[neighbors] >= 0]] += scale
+    return order
+
+
+def _compile_graph(graph: Dict[Any, List[Any]]) -> Tuple[List[Any], np.ndarray, np.ndarray]:
+    """
+    Translate an adjacency list into integer arrays for the backtracking kernel.
+
+    Vertices are ordered by _saturation_order and renumbered by that position.
+    Returns ``(ordering, pred_ptr, pred_idx)``; ``ordering`` maps positions
+    back to the original vertices.
+    """
+    vertices, indptr, indices = build_csr(graph)
+    order = _saturation_order(indptr, indices)
+    rank = np.empty(len(vertices), dtype=np.int32)
+    rank[order] = np.arange(len(vertices), dtype=np.int32)
+    pred_ptr, pred_idx = _predecessor_csr(indptr, indices, rank)
+    return [vertices[i] for i in order.tolist()], pred_ptr, pred_idx
+
+
+def _backtrack_kernel(pred_ptr, pred_idx, n_vertices, limit, labels, used, bits):
+    """
+    Iterative backtracking over vertex positions with an explicit label stack.
+
+    ``labels[i]`` holds the current label of position i (0 = unlabeled). Used
+    edge weights are kept as a bitmask split into 64-bit lanes: weight w lives
+    in ``used[w >> 6]`` at bit ``bits[w & 63]``, so the conflict test and update
+    are a single AND/OR and a backtrack is an XOR. Weights are marked while
+    being checked, so two predecessors with equal labels are rejected as a
+    collision. Returns True with ``labels`` filled on success.
+
+    Reflecting every label (l -> limit + 1 - l) maps a valid labeling to a
+    valid one, so position 0 only tries the lower half of the labels.
+    """
+    i = 0
+    while i >= 0:
+        if i == n_vertices:
+            return True
+        start = pred_ptr[i]
+        end = pred_ptr[i + 1]
+        current = labels[i]
+        # Re-entering after a backtrack: release the weights of the old label
+        if current > 0:
+            for p in range(start, end):
+                weight = current + labels[pred_idx[p]]
+                used[weight >> 6] ^= bits[weight & 63]
+        placed = False
+        top = limit if i > 0 else (limit + 1) // 2
+        for label_val in range(current + 1, top + 1):
+            q = start
+            while q < end:
+                weight = label_val + labels[pred_idx[q]]
+                bit = bits[weight & 63]
+                if used[weight >> 6] & bit:
+                    break
+                used[weight >> 6] |= bit
+                q += 1
+            if q == end:
+                labels[i] = label_val
+                placed = True
+                break
+            for p in range(start, q):
+                weight = label_val + labels[pred_idx[p]]
+                used[weight >> 6] ^= bits[weight & 63]
+        if placed:
+            i += 1
+        else:
+            labels[i] = 0
+            i -= 1
+    return False
+
+
+def _backtrack_python(preds: List[List[int]], limit: int) -> Optional[List[int]]:
+    """
+    CPython counterpart of _backtrack_kernel using one arbitrary-precision int
+    as the used-weight bitmask; each position remembers the mask it added so a
+    backtrack is a single XOR. Position 0 is symmetry-broken the same way.
+    """
+    n_vertices = len(preds)
+    labels = [0] * n_vertices
+    masks = [0] * n_vertices
+    used = 0
+    i = 0
+    while i >= 0:
+        if i == n_vertices:
+            return labels
+        used ^= masks[i]
+        pred_labels = [labels[j] for j in preds[i]]
+        top = limit if i > 0 else (limit + 1) // 2
+        for label_val in range(labels[i] + 1, top + 1):
+            mask = 0
+            for pred_label in pred_labels:
+                bit = 1 << (label_val + pred_label)
+                if (used | mask) & bit:
+                    break
+                mask |= bit
+            else:
+                labels[i] = label_val
+                masks[i] = mask
+                used |= mask
+                i += 1
+                break
+        else:
+            labels[i] = 0
+            masks[i] = 0
+            i -= 1
+    return None
+
+
+# Single-bit masks per lane position, typed to match the lane array
+_LANE_BITS = np.array([1 << b for b in range(64)], dtype=np.uint64)
+
+# Explicit signature: compiled (or loaded from the on-disk cache) at import,
+# so the first solve does not pay type inference and compilation
+_KERNEL_SIGNATURE = "boolean(int32[::1], int32[::1], int64, int64, int32[::1], uint64[::1], uint64[::1])"
+
+if _NUMBA_AVAILABLE:
+    _backtrack_kernel_jit = njit(_KERNEL_SIGNATURE, cache=True)(_backtrack_kernel)
+else:  # pragma: no cover – pure-Python fallback
+    _backtrack_kernel_jit = None
+
+
+def _run_backtrack_kernel(pred_ptr: np.ndarray, pred_idx: np.ndarray, limit: int) -> Optional[List[int]]:
+    """Dispatch to the JIT kernel when Numba is available, else to the pure-Python search."""
+    n_vertices = len(pred_ptr) - 1
+    if _backtrack_kernel_jit is not None:
+        n_lanes = (2 * limit) // 64 + 1  # a single lane while 2k <= 63
+        labels = np.zeros(n_vertices, dtype=np.int32)
+        used = np.zeros(n_lanes, dtype=np.uint64)
+        if _backtrack_kernel_jit(pred_ptr, pred_idx, n_vertices, limit, labels, used, _LANE_BITS):
+            return labels.tolist()
+        return None
+    # Plain lists are much faster than NumPy scalar indexing in CPython
+    preds = [pred_idx[pred_ptr[i]:pred_ptr[i + 1]].tolist() for i in range(n_vertices)]
+    return _backtrack_python(preds, limit)
+
+
+def jit_kernel_available() -> bool:
+    """True when the Numba-compiled backtracking kernel is in use."""
+    return _backtrack_kernel_jit is not None
 
-def compute_used_weights(graph: Dict[Any, List[Any]], labels: Dict[Any, int]) -> Set[int]:
-    """Compute the set of edge weights (sum of labels) for all labeled edges in the graph."""
-    weights: Set[int] = set()
-    for u, neighbors in graph.items():
-        if u in labels:
-            for v in neighbors:
-                if v in labels:
-                    weights.add(labels[u] + labels[v])
-    return weights
+
+def edge_irregular_lower_bound(graph: Dict[Any, List[Any]]) -> int:
+    """
+    Smallest k worth searching for an edge-irregular labeling of ``graph``.
+
+    The |E| edges need distinct weights from 2..2k, so k >= ceil((|E| + 1) / 2);
+    a vertex of degree d needs d distinct neighbor labels, so k >= d; and the
+    labels properly color the common-neighbor graph (chromatic_lb). Every k
+    below this bound would otherwise cost an exhaustive search to refute.
+    """
+    if not graph:
+        return 0
+    edge_count, max_degree = calculate_graph_metrics_from_adjacency(graph)
+    return max(math.ceil((edge_count + 1) / 2), max_degree, chromatic_lb(graph))
+
+
+def k_labeling_fixed_order(graph: Dict[Any, List[Any]], ordering: List[Any], k: int) -> Optional[Dict[Any, int]]:
+    """
+    Decide whether ``graph`` has an edge-irregular labeling with labels 1..k.
+
+    Vertices are labeled in the given ``ordering``. Returns the labeling, or
+    None when k is infeasible.
+    """
+    pred_ptr, pred_idx = _build_predecessor_csr(graph, ordering)
+    labels = _run_backtrack_kernel(pred_ptr, pred_idx, k)
+    if labels is None:
+        return None
+    return dict(zip(ordering, labels))
 
 
-def k_labeling_backtracking(graph: Dict[Any, List[Any]], k_limit: Optional[int] = None) -> Optional[Dict[Any, int]]:
+def _scan_limits_parallel(pred_ptr: np.ndarray, pred_idx: np.ndarray, limits: range,
+                          max_workers: int) -> Tuple[Optional[int], Optional[List[int]]]:
+    """
+    Try several k limits at once in a process pool; return the smallest feasible.
+
+    Up to ``max_workers`` consecutive limits run speculatively. Results are
+    consumed in increasing k, so a limit is only accepted once every smaller
+    one has failed; later limits still queued are cancelled.
+    """
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {}
+        submitted = iter(limits)
+        for limit in limits:
+            while len(futures) < max_workers:
+                next_limit = next(submitted, None)
+                if next_limit is None:
+                    break
+                futures[next_limit] = executor.submit(_run_backtrack_kernel, pred_ptr, pred_idx, next_limit)
+            labels = futures.pop(limit).result()
+            if labels is not None:
+                return limit, labels
+        return None, None
+    finally:
+        # Larger limits still running are usually feasible and finish quickly
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def k_labeling_backtracking(graph: Dict[Any, List[Any]], k_limit: Optional[int] = None,
+                            lower_bound: Optional[int] = None, max_workers: int = 1) -> Optional[Dict[Any, int]]:
     """
     Compute an edge-irregular k-labeling of the given graph using backtracking.
 
     Args:
         graph: adjacency list mapping nodes to list of neighbor nodes.
         k_limit: optional upper bound on k. If None, the function will search from lower bound up to n.
+        lower_bound: precomputed edge_irregular_lower_bound(graph), if the caller already has it.
+        max_workers: processes for a speculative parallel k scan; used only when
+            the k window holds at least PARALLEL_K_MIN_WINDOW values.
 
     Returns:
         A dict mapping nodes to labels if valid labeling is found; otherwise, None.
     """
-    # Determine search ordering: sort nodes by descending degree
-    ordering = sorted(graph.keys(), key=lambda n: len(graph[n]), reverse=True)
+    # Search ordering (saturation, then degree) and predecessor arrays, built once for all k
+    ordering, pred_ptr, pred_idx = _compile_graph(graph)
 
-    def assign_label(node_idx: int, labels: Dict[Any, int], used_weights: Set[int], limit: int) -> bool:
-        if node_idx == len(ordering):
-            return True
-        node = ordering[node_idx]
-        for label_val in range(1, limit + 1):
-            conflict = False
-            new_weights: Set[int] = set()
-            for neighbor in graph[node]:
-                if neighbor in labels:
-                    weight = label_val + labels[neighbor]
-                    # Check against existing and new weights to avoid duplicates
-                    if weight in used_weights or weight in new_weights:
-                        conflict = True
-                        break
-                    new_weights.add(weight)
-            if conflict:
-                continue
-            labels[node] = label_val
-            used_weights.update(new_weights)
-            if assign_label(node_idx + 1, labels, used_weights, limit):
-                return True
-            # Backtrack: remove label and weights
-            del labels[node]
-            used_weights.difference_update(new_weights)
-        return False
-
-    # K-limit management
-    lower_bound = max((len(neighbors) for neighbors in graph.values()), default=0)
+    # K-limit management: start at the counting/coloring bound, not the max degree
+    if lower_bound is None:
+        lower_bound = edge_irregular_lower_bound(graph)
     # search upper bound
     max_k = len(graph) if k_limit is None else k_limit
-    for limit in range(lower_bound, max_k + 1):
-        label_map: Dict[Any, int] = {}
-        used_set: Set[int] = set()
-        if assign_label(0, label_map, used_set, limit):
-            # Sanity check full-graph labeling
-            if not is_labeling_valid(graph, label_map):
-                continue
-            return label_map
-    return None 
\ No newline at end of file
+    limits = range(lower_bound, max_k + 1)
+    if max_workers > 1 and len(limits) >= PARALLEL_K_MIN_WINDOW:
+        _limit, labels = _scan_limits_parallel(pred_ptr, pred_idx, limits, max_workers)
+        return None if labels is None else _checked_label_map(graph, ordering, labels)
+    for limit in limits:
+        labels = _run_backtrack_kernel(pred_ptr, pred_idx, limit)
+        if labels is not None:
+            return _checked_label_map(graph, ordering, labels)
+    return None
+
+
+def _checked_label_map(graph: Dict[Any, List[Any]], ordering: List[Any], labels: List[int]) -> Dict[Any, int]:
+    """Map kernel labels back to the original vertices."""
+    label_map: Dict[Any, int] = dict(zip(ordering, labels))
+    # The kernel only places labels whose new weights are unused, so the
+    # result is valid by construction; the full O(E) scan is debug-only
+    assert is_labeling_valid(graph, label_map)
+    return label_map
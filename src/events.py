@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Any, Dict, Optional
+from enum import IntEnum, auto
+from typing import Any, Dict, Iterator, List, Optional
 
+import numpy as np
 
-class EventType(Enum):
-    """Enumeration of possible solver step events."""
+
+class EventType(IntEnum):
+    """Enumeration of possible solver step events (int8-castable codes)."""
 
     VERTEX_LABELED = auto()
     EDGE_WEIGHT_CALCULATED = auto()
@@ -34,4 +36,157 @@ class StepEvent:
 
     type: EventType
     data: Dict[str, Any]
-    timestamp: Optional[float] = None 
\ No newline at end of file
+    timestamp: Optional[float] = None 
+
+
+# Presence flags for the optional payload fields of a columnar event
+_HAS_VERTEX = 1
+_HAS_LABEL = 2
+_HAS_EDGE = 4
+_HAS_WEIGHT = 8
+_HAS_TIMESTAMP = 16
+_COLUMNAR_KEYS = frozenset(("vertex", "label", "edge", "weight"))
+# Recorded rows wait in a plain list and reach the columns in batches this size
+_FLUSH_EVENTS = 1024
+
+
+def _columnar_fields(data: Dict[str, Any]) -> Optional[tuple]:
+    """Split a payload into ``(vertex, label, neighbor, weight)``, or None if it does not fit."""
+    if not data.keys() <= _COLUMNAR_KEYS:
+        return None
+    edge = data.get("edge")
+    if edge is None:
+        return data.get("vertex"), data.get("label"), None, data.get("weight")
+    if "vertex" in data or not (isinstance(edge, tuple) and len(edge) == 2):
+        return None
+    return edge[0], data.get("label"), edge[1], data.get("weight")
+
+
+class EventLog:
+    """Append-only columnar store of :class:`StepEvent` data.
+
+    Recording a long solve as a list of events keeps every event object and
+    payload dict alive until the replay, so the garbage collector rescans an
+    ever-growing heap. The log instead keeps one NumPy array per field (type,
+    vertex, neighbor, label, weight, timestamp), doubled with ``np.resize``
+    when full; vertices are interned to int32 ids. Payloads that do not fit
+    those fields (e.g. ``SOLUTION_FOUND`` labels) are kept as-is on the side.
+    Storing one NumPy scalar at a time is slow, so recorded rows are queued
+    as tuples and written one slice per column every _FLUSH_EVENTS rows (or
+    before the log is read).
+
+    The log supports ``append`` like a list and yields ``StepEvent`` views on
+    iteration and indexing, so it can stand in for the recorder's buffer.
+    """
+
+    _COLUMNS = (
+        ("types", np.int8),
+        ("flags", np.int8),
+        ("vertex", np.int32),
+        ("neighbor", np.int32),
+        ("label", np.int32),
+        ("weight", np.int32),
+        ("timestamp", np.float64),
+    )
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._size = 0  # rows already in the columns
+        self._pending: List[tuple] = []  # rows still to write, in _COLUMNS order
+        self._columns = {name: np.zeros(max(capacity, 1), dtype=dtype) for name, dtype in self._COLUMNS}
+        self._vertices: List[Any] = []
+        self._vertex_ids: Dict[Any, int] = {}
+        self._extras: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return self._size + len(self._pending)
+
+    def _vertex_id(self, vertex: Any) -> int:
+        vertex_id = self._vertex_ids.get(vertex)
+        if vertex_id is None:
+            vertex_id = self._vertex_ids[vertex] = len(self._vertices)
+            self._vertices.append(vertex)
+        return vertex_id
+
+    def record(self, event_type: EventType, vertex: Any = None, label: Optional[int] = None,
+               neighbor: Any = None, weight: Optional[int] = None,
+               timestamp: Optional[float] = None) -> None:
+        """Append one event given as field values; ``neighbor`` makes it an edge event."""
+        flags = 0
+        vertex_id = neighbor_id = 0
+        if vertex is not None:
+            vertex_id = self._vertex_id(vertex)
+            flags |= _HAS_EDGE if neighbor is not None else _HAS_VERTEX
+        if neighbor is not None:
+            neighbor_id = self._vertex_id(neighbor)
+        if label is not None:
+            flags |= _HAS_LABEL
+        else:
+            label = 0
+        if weight is not None:
+            flags |= _HAS_WEIGHT
+        else:
+            weight = 0
+        if timestamp is not None:
+            flags |= _HAS_TIMESTAMP
+        else:
+            timestamp = 0.0
+        pending = self._pending
+        pending.append((event_type, flags, vertex_id, neighbor_id, label, weight, timestamp))
+        if len(pending) >= _FLUSH_EVENTS:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write the queued rows into the columns, growing them as needed."""
+        pending = self._pending
+        if not pending:
+            return
+        start = self._size
+        end = start + len(pending)
+        columns = self._columns
+        capacity = len(columns["types"])
+        if end > capacity:
+            while capacity < end:
+                capacity *= 2
+            for name in columns:
+                columns[name] = np.resize(columns[name], capacity)
+        for (name, _dtype), values in zip(self._COLUMNS, zip(*pending)):
+            columns[name][start:end] = values
+        self._size = end
+        pending.clear()
+
+    def append(self, event: StepEvent) -> None:
+        """Store *event*, splitting its payload into the columns when possible."""
+        fields = _columnar_fields(event.data)
+        if fields is None:
+            self._extras[len(self)] = event.data
+            self.record(event.type, timestamp=event.timestamp)
+        else:
+            self.record(event.type, *fields, timestamp=event.timestamp)
+
+    def __getitem__(self, index: int) -> StepEvent:
+        self._flush()
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("event index out of range")
+        columns = self._columns
+        flags = int(columns["flags"][index])
+        if index in self._extras:
+            data = self._extras[index]
+        else:
+            data = {}
+            if flags & _HAS_VERTEX:
+                data["vertex"] = self._vertices[columns["vertex"][index]]
+            if flags & _HAS_EDGE:
+                data["edge"] = (self._vertices[columns["vertex"][index]], self._vertices[columns["neighbor"][index]])
+            if flags & _HAS_LABEL:
+                data["label"] = int(columns["label"][index])
+            if flags & _HAS_WEIGHT:
+                data["weight"] = int(columns["weight"][index])
+        timestamp = float(columns["timestamp"][index]) if flags & _HAS_TIMESTAMP else None
+        return StepEvent(EventType(int(columns["types"][index])), data, timestamp)
+
+    def __iter__(self) -> Iterator[StepEvent]:
+        self._flush()
+        for index in range(self._size):
+            yield self[index]
@@ -1,5 +1,8 @@
 import collections
-from typing import Dict, List, Any
+import functools
+from typing import Dict, List, Any, Tuple
+
+import numpy as np
 
 
 def generate_ladder_graph(n):
@@ -35,6 +38,19 @@ def generate_ladder_graph(n):
     return graph
 
 
+def _thaw_adjacency(frozen: Tuple[Tuple[Any, Tuple[Any, ...]], ...]) -> Dict[Any, List[Any]]:
+    """Return a fresh mutable adjacency list from a cached frozen one."""
+    graph = collections.defaultdict(list)
+    for vertex, neighbors in frozen:
+        graph[vertex] = list(neighbors)
+    return graph
+
+
+def _freeze_adjacency(graph: Dict[Any, List[Any]]) -> Tuple[Tuple[Any, Tuple[Any, ...]], ...]:
+    """Freeze an adjacency list (preserving vertex and neighbor order) for caching."""
+    return tuple((vertex, tuple(neighbors)) for vertex, neighbors in graph.items())
+
+
 def create_mongolian_tent_graph(tent_size: int) -> Dict[Any, List[Any]]:
     """
     Generate a Mongolian Tent graph MT_{3,n} for a given integer tent_size.
@@ -49,8 +65,14 @@ def create_mongolian_tent_graph(tent_size: int) -> Dict[Any, List[Any]]:
         - ai-docs/initial-design/task_1.md  (Mongolian Tent graph construction)
         - ai-docs/initial-design/master_plan.md  (design overview of MT graphs)
     """
+    # Callers receive their own copy, so mutating it never corrupts the cache
+    return _thaw_adjacency(_mongolian_tent_graph_frozen(tent_size))
+
+
+@functools.lru_cache(maxsize=128)
+def _mongolian_tent_graph_frozen(tent_size: int) -> Tuple[Tuple[Any, Tuple[Any, ...]], ...]:
     if tent_size <= 0:
-        return collections.defaultdict(list)
+        return ()
 
     graph = generate_ladder_graph(tent_size)
     apex_vertex = 'x'
@@ -62,13 +84,63 @@ def create_mongolian_tent_graph(tent_size: int) -> Dict[Any, List[Any]]:
         graph[apex_vertex].append(top_vertex)
         graph[top_vertex].append(apex_vertex)
 
-    return graph
+    return _freeze_adjacency(graph)
+
+def _tent_vertex_table(tent_size: int) -> List[Any]:
+    """Vertices of MT_{3,n} in the key order of create_mongolian_tent_graph()."""
+    if tent_size == 1:
+        head = [(1, 1), (2, 1), (3, 1)]
+    else:
+        # The first ladder column pair is inserted row by row, later columns one at a time
+        head = [(1, 1), (1, 2), (2, 1), (2, 2), (3, 1), (3, 2)]
+    return head + [(row, col) for col in range(3, tent_size + 1) for row in (1, 2, 3)] + ['x']
+
+
+def create_mongolian_tent_graph_csr(tent_size: int) -> Tuple[np.ndarray, np.ndarray, List[Any]]:
+    """
+    CSR arrays of MT_{3,n}, computed by index arithmetic instead of from the dict.
+
+    Returns ``(indptr, indices, id2vertex)`` identical to
+    ``build_csr(create_mongolian_tent_graph(tent_size))``: same vertex ids and
+    the same neighbor order (horizontal, then vertical, then apex).
+    """
+    if tent_size <= 0:
+        return np.zeros(1, dtype=np.int32), np.zeros(0, dtype=np.int32), []
+    id2vertex = _tent_vertex_table(tent_size)
+    ladder = np.array(id2vertex[:-1], dtype=np.int64)
+    rows, cols = ladder[:, 0], ladder[:, 1]
+
+    # Id of (row, col); the first one or two columns follow the insertion order above
+    def vertex_id(row, col):
+        if tent_size == 1:
+            return row - 1
+        return np.where(col <= 2, 2 * (row - 1) + (col - 1), 6 + 3 * (col - 3) + (row - 1))
+
+    apex = 3 * tent_size
+    # Candidate neighbor slots per vertex, in adjacency-list order
+    candidates = np.stack([
+        vertex_id(rows, cols - 1),
+        vertex_id(rows, cols + 1),
+        vertex_id(np.where(rows == 2, 1, 2), cols),
+        vertex_id(np.full_like(rows, 3), cols),
+        np.full_like(rows, apex),
+    ], axis=1)
+    valid = np.stack([cols > 1, cols < tent_size, np.ones_like(rows, dtype=bool), rows == 2, rows == 1], axis=1)
+
+    indptr = np.zeros(apex + 2, dtype=np.int32)
+    np.cumsum(valid.sum(axis=1), out=indptr[1:apex + 1])
+    indptr[apex + 1] = indptr[apex] + tent_size
+    top_row = vertex_id(np.ones(tent_size, dtype=np.int64), np.arange(1, tent_size + 1))
+    indices = np.concatenate([candidates[valid], top_row]).astype(np.int32)
+    return indptr, indices, id2vertex
+
 
 def generate_circulant_graph(n: int, r: int) -> Dict[int, List[int]]:
     """
-    Generate a circulant graph by removing edges from the complete circulant K_n to reduce each vertex's degree by 5.
+    Generate the circulant obtained from the complete circulant K_n by dropping generators s=1,2,n/2.
 
-    Only valid for even n ≥ 6. It removes generators s=1,2,n/2 in that order.
+    Only valid for even n ≥ 6. The kept generators are s=3..n/2-1, emitted
+    directly (the adjacency equals building K_n and deleting the dropped edges).
     Final degree = (n-1) - 5 = n - 6.
 
     Args:
@@ -82,24 +154,22 @@ def generate_circulant_graph(n: int, r: int) -> Dict[int, List[int]]:
         - ai-docs/algorithms/circulant_graph_generation_algorithm.md  (circulant graph generation logic)
         - ai-docs/enhancments/enhancement03_circulant_graph.md  (improvements and edge-removal strategy)
     """
+    # r does not affect the construction, so the cache is keyed on n alone
+    return _thaw_adjacency(_circulant_graph_frozen(n))
+
+
+@functools.lru_cache(maxsize=128)
+def _circulant_graph_frozen(n: int) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
     # Validate n even and sufficient size
     if not (6 <= n <= 50 and n % 2 == 0):
-        return collections.defaultdict(list)
-    graph = collections.defaultdict(list)
+        return ()
     half = n // 2
-    # Step 1: build complete circulant K_n adjacency
-    for s in range(1, half + 1):
+    # Build the final adjacency directly from the kept generators instead of
+    # building K_n and deleting s = 1, 2, n/2 with O(deg) list.remove calls
+    graph = {i: [] for i in range(n)}
+    for s in range(3, half):
         for i in range(n):
             j = (i + s) % n
             graph[i].append(j)
             graph[j].append(i)
-    # Step 2: remove closest neighbor edges first
-    for s in (1, 2, half):
-        for i in range(n):
-            j = (i + s) % n
-            # remove edge i<->j if exists
-            if j in graph[i]:
-                graph[i].remove(j)
-            if i in graph[j]:
-                graph[j].remove(i)
-    return graph 
\ No newline at end of file
+    return _freeze_adjacency(graph)
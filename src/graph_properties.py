@@ -1,7 +1,10 @@
-from src.graph_generator import create_mongolian_tent_graph
 import math
 from typing import Dict, List, Any, Tuple
-import collections
+import hashlib
+import json
+import os
+from src.constants import DIAMETER_CACHE_DIR
+from src.csr_graph import build_csr, csr_diameter, csr_double_sweep, csr_eccentricity
 
 def calculate_circulant_lower_bound(n: int, r: int) -> int:
     """
@@ -47,41 +50,52 @@ def calculate_graph_metrics_from_adjacency(adjacency_list: Dict[Any, List[Any]])
     if not adjacency_list:
         return 0, 0
 
+    # One C-level pass for the degrees; sum() and max() then run without
+    # per-vertex generator frames
+    degrees = list(map(len, adjacency_list.values()))
+
     # Count edges (each edge is counted twice in undirected graph)
-    edge_count = sum(len(neighbors) for neighbors in adjacency_list.values()) // 2
-    
-    # Find maximum degree
-    max_degree = max(len(neighbors) for neighbors in adjacency_list.values()) if adjacency_list else 0
-    
-    return edge_count, max_degree
+    return sum(degrees) // 2, max(degrees)
 
 # Legacy function for backward compatibility - try to use networkx if available
 def calculate_graph_metrics(graph) -> tuple:
     """
     Calculates the number of edges and the maximum degree of a graph.
     Supports both NetworkX graphs and adjacency list dictionaries.
+
+    Adjacency dicts are handled first, so they never pay the networkx import.
     """
+    if isinstance(graph, dict):
+        return calculate_graph_metrics_from_adjacency(graph)
+
     try:
         import networkx as nx
         if isinstance(graph, nx.Graph):
             if not graph:
                 return 0, 0
-            edge_count = graph.number_of_edges()
-            max_degree = max([degree for node, degree in graph.degree()]) if graph.nodes() else 0
-            return edge_count, max_degree
+            return graph.number_of_edges(), max(degree for _node, degree in graph.degree())
     except ImportError:
         pass
-    
-    # Fallback to adjacency list calculation
-    if isinstance(graph, dict):
-        return calculate_graph_metrics_from_adjacency(graph)
-    
+
     return 0, 0
 
+def _mt_edge_count(tent_size: int) -> int:
+    """Edges of MT_{3,n}: 3(n-1) row edges, 2n rungs and n apex spokes."""
+    return 6 * tent_size - 3
+
+def _mt_max_degree(tent_size: int) -> int:
+    """Maximum degree of MT_{3,n}: the apex has n, interior ladder vertices up to 4."""
+    return max(tent_size, min(tent_size + 1, 4))
+
 def calculate_lower_bound(tent_size: int) -> int:
     """
     Calculates the theoretical lower bound for k for a Mongolian Tent Graph.
 
+    Edge count and maximum degree are closed-form in n, so the graph is not
+    built. The coloring bound of chromatic_lb() is n + 1 for n >= 2 (the apex
+    and the top row) and never exceeds the counting bound 3n - 1, so it is
+    not added here; tests check the formula against the built graph.
+
     Args:
         tent_size (int): The size parameter for the Mongolian Tent Graph.
 
@@ -94,14 +108,35 @@ def calculate_lower_bound(tent_size: int) -> int:
     """
     if tent_size <= 0:
         return 0
-    
-    graph_adj = create_mongolian_tent_graph(tent_size)
-    edge_count, max_degree = calculate_graph_metrics_from_adjacency(graph_adj)
-    
+
     # Lower bound formula: k >= max(ceil((|E(G)| + 1) / 2), delta(G))
-    lower_bound_k = max(math.ceil((edge_count + 1) / 2), max_degree)
-    
-    return lower_bound_k 
+    return max(math.ceil((_mt_edge_count(tent_size) + 1) / 2), _mt_max_degree(tent_size))
+
+def chromatic_lb(adjacency_list: Dict[Any, List[Any]]) -> int:
+    """
+    Coloring-based lower bound on k for an edge-irregular labeling.
+
+    Two vertices with a common neighbor w must receive different labels,
+    otherwise the edges to w would share a weight. Labels therefore properly
+    color the "common-neighbor" graph H, so the size of any clique in H bounds
+    k from below. A clique is grown greedily from every vertex; a coloring
+    heuristic such as DSatur is not used since it only bounds chi(H) from above.
+    """
+    conflicts: Dict[Any, set] = {vertex: set() for vertex in adjacency_list}
+    for neighbors in adjacency_list.values():
+        for u in neighbors:
+            conflicts.setdefault(u, set()).update(v for v in neighbors if v != u)
+    best = 1 if conflicts else 0
+    for vertex, candidates in conflicts.items():
+        clique_size = 1
+        candidates = set(candidates)
+        while candidates:
+            # Extend with the candidate that keeps the most other candidates alive
+            pick = max(candidates, key=lambda c: (len(conflicts[c] & candidates), repr(c)))
+            clique_size += 1
+            candidates &= conflicts[pick]
+        best = max(best, clique_size)
+    return best
    
 def is_regular(adjacency_list: Dict[Any, List[Any]], r: int) -> bool:
     """
@@ -114,24 +149,90 @@ def is_regular(adjacency_list: Dict[Any, List[Any]], r: int) -> bool:
         return False
     return all(len(neighbors) == r for neighbors in adjacency_list.values())
 
-def compute_diameter(adjacency_list: Dict[Any, List[Any]]) -> int:
+def is_circulant(adjacency_list: Dict[Any, List[Any]]) -> bool:
+    """
+    Check whether the graph is a circulant on vertices 0..n-1.
+
+    Every neighborhood must be the neighborhood of vertex 0 shifted by the
+    vertex id (mod n). Circulants are vertex-transitive, so any single
+    eccentricity equals the diameter.
+    """
+    n = len(adjacency_list)
+    if n == 0 or set(adjacency_list) != set(range(n)):
+        return False
+    base = adjacency_list[0]
+    if not is_regular(adjacency_list, len(base)):
+        return False
+    return all(
+        set(adjacency_list[i]) == {(j + i) % n for j in base}
+        for i in range(1, n)
+    )
+
+def compute_diameter(adjacency_list: Dict[Any, List[Any]], exact: bool = True, max_workers: int = 1) -> int:
     """
     Compute the diameter of the graph (longest shortest-path between any two vertices).
 
+    The graph is converted to CSR arrays once and every BFS walks those flat
+    arrays instead of the adjacency dict. Circulant graphs take a single BFS
+    from vertex 0. Otherwise ``exact=False`` returns the O(V+E) double-sweep
+    lower bound; the exact path runs iFUB, whose fringe BFS can be spread over
+    ``max_workers`` processes (see csr_diameter).
+
     References:
         - ai-docs/enhancments/enhancement02_shape_graph.md (use cases for diameter)
     """
     if not adjacency_list:
         return 0
-    diameter = 0
-    for source in adjacency_list:
-        visited = {source}
-        queue = collections.deque([(source, 0)])
-        while queue:
-            node, dist = queue.popleft()
-            diameter = max(diameter, dist)
-            for neighbor in adjacency_list[node]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, dist + 1))
-    return diameter 
\ No newline at end of file
+    _vertices, indptr, indices = build_csr(adjacency_list)
+    if is_circulant(adjacency_list):
+        return csr_eccentricity(indptr, indices, 0)[0]
+    if not exact:
+        return csr_double_sweep(indptr, indices)
+    return csr_diameter(indptr, indices, max_workers=max_workers)
+
+def graph_structure_key(adjacency_list: Dict[Any, List[Any]]) -> str:
+    """
+    Return a stable content hash of the graph's edge set.
+
+    Vertices are canonicalized via repr() so mixed vertex types (tuples and the
+    apex 'x') sort deterministically; the key is independent of insertion order.
+    """
+    edges = set()
+    for vertex in adjacency_list:
+        vertex_repr = repr(vertex)
+        for neighbor in adjacency_list[vertex]:
+            neighbor_repr = repr(neighbor)
+            edges.add((vertex_repr, neighbor_repr) if vertex_repr <= neighbor_repr else (neighbor_repr, vertex_repr))
+    vertices = sorted(repr(vertex) for vertex in adjacency_list)
+    payload = json.dumps([vertices, sorted(edges)], separators=(',', ':'))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+def compute_diameter_persistent(adjacency_list: Dict[Any, List[Any]], cache_dir: str = DIAMETER_CACHE_DIR,
+                                exact: bool = True, max_workers: int = 1) -> int:
+    """
+    compute_diameter() backed by an on-disk JSON cache keyed on graph structure.
+
+    Only the exact iFUB diameter is cached: warm runs on an identical graph skip
+    it entirely. Circulants (a single BFS) and the double-sweep estimate
+    (``exact=False``) are cheaper to compute than to hash the graph and read the
+    cache, so they bypass it. Cache I/O errors are ignored and fall back to
+    computing the diameter.
+    """
+    if not exact or not adjacency_list or is_circulant(adjacency_list):
+        return compute_diameter(adjacency_list, exact=exact)
+
+    cache_file = os.path.join(cache_dir, f"{graph_structure_key(adjacency_list)}.json")
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return int(json.load(f)['diameter'])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    diameter = compute_diameter(adjacency_list, max_workers=max_workers)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({'diameter': diameter}, f)
+    except OSError:
+        pass
+    return diameter
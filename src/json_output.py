@@ -0,0 +1,57 @@
+"""JSON serialization helpers for solver results.
+
+Uses orjson when it is installed and falls back to the standard library
+``json`` module otherwise. Graph results are streamed to disk one vertex/edge
+at a time so large graphs are never materialized as a single dict.
+"""
+import json
+from typing import Any, Dict, Iterable
+
+try:
+    import orjson  # type: ignore
+    _ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover – fallback when dependency not installed
+    orjson = None  # type: ignore
+    _ORJSON_AVAILABLE = False
+
+
+def _encode(obj: Any) -> str:
+    """Encode a single JSON value compactly."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+    return json.dumps(obj, separators=(", ", ": "))
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Serialize ``obj`` as UTF-8 JSON bytes indented by two spaces."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_graph_json(file_name: str, header: Dict[str, Any],
+                     vertices: Iterable[Dict[str, Any]], edges: Iterable[Dict[str, Any]]) -> None:
+    """
+    Stream a graph result document to ``file_name``.
+
+    The header fields are written first, followed by the ``vertices`` and
+    ``edges`` arrays with one element per line, consuming both iterables lazily.
+    Header keys may not reuse the section names, which would emit duplicate keys.
+    """
+    clashing = {"vertices", "edges"}.intersection(header)
+    if clashing:
+        raise ValueError(f"Header keys clash with graph sections: {sorted(clashing)}")
+    with open(file_name, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        for key, value in header.items():
+            f.write(f"    {_encode(key)}: {_encode(value)},\n")
+        for section, items, last in (("vertices", vertices, False), ("edges", edges, True)):
+            f.write(f'    "{section}": [')
+            separator = "\n        "
+            for item in items:
+                f.write(separator)
+                f.write(_encode(item))
+                separator = ",\n        "
+            f.write("\n    ]" if separator != "\n        " else "]")
+            f.write("\n" if last else ",\n")
+        f.write("}\n")
@@ -11,10 +11,19 @@ References:
     - ai-docs/fixes/fix_backtracking_performance.md (optimization notes)
     - ai-docs/enhancments/enhancement01_Task_1.md (solver feature roadmap)
 """
+import functools
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from types import MappingProxyType
+
+from src.csr_graph import build_csr
 from src.graph_generator import create_mongolian_tent_graph, generate_circulant_graph
 from src.graph_properties import calculate_lower_bound, calculate_circulant_lower_bound
-from src.constants import MAX_K_MULTIPLIER_DEFAULT, GREEDY_ATTEMPTS_DEFAULT
-from typing import Any, Tuple, Union, Dict, List, Optional, Callable
+from src.constants import (
+    MAX_K_MULTIPLIER_DEFAULT, GREEDY_ATTEMPTS_DEFAULT, PARALLEL_GREEDY_MIN_ATTEMPTS,
+    PRIMAL_HEURISTIC_ATTEMPTS, PRIMAL_HEURISTIC_K_SLACK,
+)
+from typing import Any, Tuple, Dict, List, Mapping, Optional, Callable
 
 # Animation event type imports (optional – avoid hard dependency when unused)
 from importlib import import_module
@@ -23,72 +32,35 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.events import StepEvent as StepEvent  # noqa: F401  (re-export for typing)
     from src.events import EventType as EventType  # noqa: F401
+    from src.events import EventLog as EventLog  # noqa: F401
 else:
     try:
         _events_mod = import_module("src.events")
         StepEvent = getattr(_events_mod, "StepEvent")  # type: ignore
         EventType = getattr(_events_mod, "EventType")  # type: ignore
+        EventLog = getattr(_events_mod, "EventLog")  # type: ignore
     except Exception:  # pragma: no cover – animation module unavailable
         StepEvent = None  # type: ignore
         EventType = None  # type: ignore
+        EventLog = None  # type: ignore
 
 
-try:
-    from bitarray import bitarray  # type: ignore
-    _BITARRAY_AVAILABLE = True
-except ImportError:  # pragma: no cover – fallback when dependency not installed
-    bitarray = None  # type: ignore
-    _BITARRAY_AVAILABLE = False
-
-
-def _init_used_weights(length: int):  # noqa: D401 – simple factory helper
-    """Return a zero-initialised weight-usage mask.
-
-    Uses *bitarray* when available for O(1) index ops on a compact
-    contiguous bit-set (~8× memory saving & a noticeable speed-up in inner
-    loops).  Falls back to a Python list of bools when the library is not
-    installed.
-    """
-    if _BITARRAY_AVAILABLE and bitarray is not None:
-        mask = bitarray(length)  # type: ignore[operator]
-        mask.setall(False)
-        return mask
-    # Fallback – regular Python list
-    return [False] * length
-
-def _get_vertex_sort_key(v: Union[Tuple[int, int], str]) -> Tuple[int, str, str]:
-    if isinstance(v, tuple):
-        # (type_discriminator, row_as_str_padded, col_as_str_padded)
-        # Use zfill to ensure consistent lexicographical sorting for numbers
-        return (0, str(v[0]).zfill(3), str(v[1]).zfill(3)) # Assuming max 3 digits for row/col
-    elif v == 'x':
-        # (type_discriminator, padded_placeholder_str, padded_placeholder_str)
-        return (1, '000', '000') # Consistent padding for 'x', and matching length of other string parts
-    else:
-        # Fallback for any other unexpected vertex types, sorted by string
-        # (type_discriminator, string_representation_padded, empty_string_padding)
-        # Ensure the third element is also a string of consistent length
-        return (2, str(v).zfill(10), '000') # Make all tuples (int, str, str)
-
-def _get_generic_vertex_sort_key(v: Any) -> Tuple[int, ...]:
-    """Return a stable sort key for any vertex type."""
-    if isinstance(v, tuple): # For Mongolian Tent (row, col)
-        return (0, v[0], v[1])
-    elif isinstance(v, int): # For Circulant graphs (integer IDs)
-        return (1, v)
-    elif v == 'x': # For Mongolian Tent apex
-        return (2,)
-    else: # Fallback for other types
-        return (3, str(v))
-
-def is_labeling_valid(adjacency_list: Dict[Any, List[Any]], vertex_labels: Dict[Any, int], last_vertex: Optional[Any] = None, sort_key_func: Callable[[Any], Tuple[int, ...]] = _get_vertex_sort_key) -> bool:
+def is_labeling_valid(adjacency_list: Dict[Any, List[Any]], vertex_labels: Dict[Any, int], last_vertex: Optional[Any] = None, k_upper: Optional[int] = None, vertex_ids: Optional[Mapping[Any, int]] = None) -> bool:
     """
     Check if the current labeling is valid for the graph.
 
+    Used weights are tracked in a dense list of flags indexed by weight instead
+    of a hashed set; weights lie in [2, 2 * k_upper]. A plain list indexes
+    faster than a set or a bitarray in CPython. Each undirected edge is taken
+    once, from the endpoint with the smaller integer id.
+
     Args:
         adjacency_list: adjacency list of the graph.
         vertex_labels: mapping of vertex -> label.
         last_vertex: if provided, only validate edges incident on this vertex; otherwise, validate the entire graph.
+        k_upper: upper bound on the labels, sizing the weight mask; defaults to the largest label.
+        vertex_ids: distinct integer id per vertex, precomputed by callers that validate repeatedly;
+            defaults to the adjacency-list order.
 
     Returns:
         True if the labeling is valid (no duplicate edge weights), False otherwise.
@@ -97,45 +69,59 @@ def is_labeling_valid(adjacency_list: Dict[Any, List[Any]], vertex_labels: Dict[
         - ai-docs/algorithms/backtracking_algorithm.md (edge weight uniqueness definition)
         - ai-docs/fixes/fix_greedy_inefficiency.md (incremental validation optimizations)
     """
+    if k_upper is None:
+        k_upper = max(vertex_labels.values(), default=0)
+    used = [False] * (2 * k_upper + 1)
+    if vertex_ids is None:
+        vertex_ids = {v: i for i, v in enumerate(adjacency_list)}
+
     if last_vertex is not None:
         if last_vertex not in vertex_labels:
             return True  # Should not happen if called correctly
         last_label = vertex_labels[last_vertex]
-        existing_weights: set[int] = set()
         # Collect weights from the rest of the graph
         for source_vertex, neighbors in adjacency_list.items():
             if source_vertex == last_vertex or source_vertex not in vertex_labels:
                 continue
             for target_vertex in neighbors:
                 if target_vertex != last_vertex and target_vertex in vertex_labels:
-                    if sort_key_func(source_vertex) < sort_key_func(target_vertex):
-                        existing_weights.add(vertex_labels[source_vertex] + vertex_labels[target_vertex])
+                    if vertex_ids[source_vertex] < vertex_ids[target_vertex]:
+                        used[vertex_labels[source_vertex] + vertex_labels[target_vertex]] = True
         # Check new weights from the last vertex
         for neighbor in adjacency_list[last_vertex]:
             if neighbor in vertex_labels:
                 weight = last_label + vertex_labels[neighbor]
-                if weight in existing_weights:
+                if used[weight]:
                     return False
-                existing_weights.add(weight)
+                used[weight] = True
         return True
 
     # Full validation when last_vertex is not specified
-    weights: set[int] = set()
     for source_vertex, neighbors in adjacency_list.items():
         if source_vertex not in vertex_labels:
             continue
         for target_vertex in neighbors:
-            if target_vertex in vertex_labels and sort_key_func(source_vertex) < sort_key_func(target_vertex):
+            if target_vertex in vertex_labels and vertex_ids[source_vertex] < vertex_ids[target_vertex]:
                 weight = vertex_labels[source_vertex] + vertex_labels[target_vertex]
-                if weight in weights:
+                if used[weight]:
                     return False
-                weights.add(weight)
+                used[weight] = True
     return True
 
 # --------------------
 # Solver base emit helper
 # --------------------
 
+@functools.lru_cache(maxsize=None)
+def _cached_tent_graph(tent_size: int) -> Mapping[Any, Tuple[Any, ...]]:
+    """Read-only MT_{3,n} adjacency, built once and shared by repeated solves."""
+    return MappingProxyType({v: tuple(nbrs) for v, nbrs in create_mongolian_tent_graph(tent_size).items()})
+
+@functools.lru_cache(maxsize=None)
+def _cached_circulant_graph(n: int, r: int) -> Mapping[int, Tuple[int, ...]]:
+    """Read-only C(n, r) adjacency, built once and shared by repeated solves."""
+    return MappingProxyType({v: tuple(nbrs) for v, nbrs in generate_circulant_graph(n, r).items()})
+
 def _maybe_emit(callback: Optional[Callable[["StepEvent"], None]], event: Optional["StepEvent"]):
     """Safely invoke *callback* with *event* if both are provided.
 
@@ -150,22 +136,60 @@ def _maybe_emit(callback: Optional[Callable[["StepEvent"], None]], event: Option
             # Fail-safe: ignore animation issues
             pass
 
+
+def _step_emitters(callback: Callable[["StepEvent"], None]) -> Tuple[Callable, Callable, Callable]:
+    """(labeled, weighed, backtracked) emitters of the solver step events for *callback*.
+
+    For a recorder whose buffer is an EventLog, the log's ``record`` takes the
+    field values directly, without building a StepEvent and payload dict that
+    the log would only split up again. Other callbacks receive StepEvents
+    through _maybe_emit.
+    """
+    buffer = getattr(callback, "buffer", None)
+    if EventLog is not None and isinstance(buffer, EventLog):
+        record = buffer.record
+        def labeled(vertex: Any, label: int) -> None:
+            record(EventType.VERTEX_LABELED, vertex, label)
+
+        def weighed(vertex: Any, neighbor: Any, weight: int) -> None:
+            record(EventType.EDGE_WEIGHT_CALCULATED, vertex, neighbor=neighbor, weight=weight)
+
+        def backtracked(vertex: Any) -> None:
+            record(EventType.BACKTRACK, vertex)
+    else:
+        def labeled(vertex: Any, label: int) -> None:
+            _maybe_emit(callback, StepEvent(EventType.VERTEX_LABELED, {"vertex": vertex, "label": label}))
+
+        def weighed(vertex: Any, neighbor: Any, weight: int) -> None:
+            _maybe_emit(
+                callback, StepEvent(EventType.EDGE_WEIGHT_CALCULATED, {"edge": (vertex, neighbor), "weight": weight})
+            )
+
+        def backtracked(vertex: Any) -> None:
+            _maybe_emit(callback, StepEvent(EventType.BACKTRACK, {"vertex": vertex}))
+    return labeled, weighed, backtracked
+
 def _backtrack_k_labeling_generic(
     adjacency_list: Dict[Any, List[Any]],
     max_k_value: int,
     vertex_labels: Dict[Any, int],
     unlabeled_vertices: List[Any],
-    used_weights: List[bool],
+    used: int = 0,
     on_step: Optional[Callable[["StepEvent"], None]] = None,
 ) -> Optional[Dict[Any, int]]:
     """
     Recursively find a valid k-labeling using backtracking.
 
+    The graph is converted once to CSR lists (see build_csr) and labels live in
+    a dense list indexed by vertex id, 0 meaning unlabeled, so the search
+    indexes flat lists instead of hashing vertex tuples.
+
     Args:
         adjacency_list: adjacency list of the graph.
         max_k_value: maximum label value to use.
         vertex_labels: current partial mapping of vertices to labels.
         unlabeled_vertices: list of vertices remaining to label.
+        used: int bitmask of the weights already taken by ``vertex_labels`` (bit w = weight w).
 
     Returns:
         A dict mapping vertices to labels if a complete valid labeling is found, otherwise None.
@@ -174,74 +198,158 @@ def _backtrack_k_labeling_generic(
         - ai-docs/algorithms/backtracking_algorithm.md (recursive algorithm pseudocode)
         - ai-docs/fixes/fix_backtracking_performance.md (bit-array optimization)
     """
-    if not unlabeled_vertices:
-        # Base case: all vertices are labeled — verify full validity before accepting
-        if is_labeling_valid(adjacency_list, vertex_labels, sort_key_func=_get_generic_vertex_sort_key):
-            return vertex_labels
+    if on_step is None and not vertex_labels and not used:
+        # Nothing to animate: the edge-irregular solver's Numba kernel runs the
+        # same fixed-order search natively (imported lazily, as it loads numba)
+        from src.edge_irregular_solver import jit_kernel_available, k_labeling_fixed_order
+        if jit_kernel_available():
+            return k_labeling_fixed_order(adjacency_list, unlabeled_vertices, max_k_value)
+
+    vertices, indptr, indices = build_csr(adjacency_list)
+    vertex_ids = {v: i for i, v in enumerate(vertices)}
+    labels = [0] * len(vertices)
+    for vertex, label in vertex_labels.items():
+        labels[vertex_ids[vertex]] = label
+    order = [vertex_ids[v] for v in unlabeled_vertices]
+    # Events are only built when someone listens
+    emit = on_step if StepEvent and EventType else None
+    if not _backtrack_csr(indptr.tolist(), indices.tolist(), labels, order, max_k_value, used, vertices, emit):
         return None
+    for i in order:
+        vertex_labels[vertices[i]] = labels[i]
+    return vertex_labels
 
-    vertex_to_label = unlabeled_vertices[0]
-    remaining_vertices = unlabeled_vertices[1:]
-
-    for label in range(1, max_k_value + 1):
-        if StepEvent and EventType:
-            _maybe_emit(
-                on_step,
-                StepEvent(EventType.VERTEX_LABELED, {"vertex": vertex_to_label, "label": label}),
-            )
-        vertex_labels[vertex_to_label] = label
-        new_weights: List[int] = []
-        conflict = False
-        for neighbor in adjacency_list[vertex_to_label]:
-            if neighbor in vertex_labels:
-                weight = label + vertex_labels[neighbor]
-                if StepEvent and EventType:
-                    _maybe_emit(
-                        on_step,
-                        StepEvent(
-                            EventType.EDGE_WEIGHT_CALCULATED,
-                            {"edge": (vertex_to_label, neighbor), "weight": weight},
-                        ),
-                    )
-                # Check against bit-array mask
-                if weight < len(used_weights) and used_weights[weight]:
-                    conflict = True
+def _backtrack_csr(
+    indptr: List[int],
+    indices: List[int],
+    labels: List[int],
+    order: List[int],
+    max_k_value: int,
+    used: int,
+    vertices: List[Any],
+    on_step: Optional[Callable[["StepEvent"], None]],
+) -> bool:
+    """
+    Label every vertex of ``order``; on success ``labels`` holds the complete labeling.
+
+    An explicit stack replaces recursion: per depth it keeps the used-weight
+    bitmask on entry (bit w = weight w), the labeled neighbors and their
+    labels, and the labels still to try, so backtracking just pops a depth.
+    The order is fixed, so the neighbors labeled before each vertex (earlier
+    in ``order`` or preassigned) are listed once up front. Before trying labels,
+    the labels that would repeat a weight are collected in one pass: for a
+    labeled neighbor with label ln, label l is forbidden exactly when bit l
+    of ``used >> ln`` is set. Two labeled neighbors with equal labels would
+    give every label a repeated weight, so the vertex fails outright. The
+    remaining labels are taken in increasing order by popping the lowest
+    set bit.
+
+    From an empty labeling, reflecting every label (l -> k + 1 - l) maps a
+    valid labeling to a valid one, so the first vertex only needs the lower
+    half of the labels, as in the edge-irregular kernel.
+    """
+    n_order = len(order)
+    if on_step is not None:
+        labeled, weighed, backtracked = _step_emitters(on_step)
+    label_bits = ((1 << max_k_value) - 1) << 1  # labels 1..k
+    root_bits = label_bits
+    if not used and not any(labels):
+        root_bits = ((1 << ((max_k_value + 1) // 2)) - 1) << 1
+    rank = [-1] * len(labels)
+    for position, vertex in enumerate(order):
+        rank[vertex] = position
+    predecessors = [
+        [u for u in indices[indptr[vertex]:indptr[vertex + 1]] if labels[u] or 0 <= rank[u] < position]
+        for position, vertex in enumerate(order)
+    ]
+    used_at = [used] + [0] * n_order
+    neighbor_labels_at: List[List[int]] = [[] for _ in range(n_order)]
+    free_at = [0] * n_order
+    depth = 0
+    entering = True
+    while True:
+        if entering:
+            if depth == n_order:
+                return True
+            neighbor_labels = [labels[u] for u in predecessors[depth]]
+            forbidden = 0
+            seen = 0
+            for neighbor_label in neighbor_labels:
+                if seen >> neighbor_label & 1:
+                    forbidden = -1  # all bits set: no label is possible
                     break
-                new_weights.append(weight)
-        if not conflict:
-            # Mark new weights in bit-array mask
-            for w in new_weights:
-                used_weights[w] = True
-
-            # Recurse with updated weights
-            result = _backtrack_k_labeling_generic(
-                adjacency_list,
-                max_k_value,
-                vertex_labels,
-                remaining_vertices,
-                used_weights,
-                on_step,
-            )
-            if result is not None:
-                return result  # Found a solution
-            # Backtrack bit-array flags
-            for w in new_weights:
-                used_weights[w] = False
-    # Backtrack if no valid label was found
-    if StepEvent and EventType and vertex_to_label in vertex_labels:
-        _maybe_emit(
-            on_step,
-            StepEvent(EventType.BACKTRACK, {"vertex": vertex_to_label}),
-        )
-    del vertex_labels[vertex_to_label]
-    return None
+                seen |= 1 << neighbor_label
+                forbidden |= used_at[depth] >> neighbor_label
+            neighbor_labels_at[depth] = neighbor_labels
+            free_at[depth] = ~forbidden & (label_bits if depth else root_bits)
+        vertex = order[depth]
+        labels[vertex] = 0
+        free = free_at[depth]
+        if not free:
+            # Backtrack if no valid label was found
+            if on_step is not None:
+                backtracked(vertices[vertex])
+            if depth == 0:
+                return False
+            depth -= 1
+            entering = False
+            continue
+        lowest = free & -free
+        free_at[depth] = free ^ lowest
+        label = lowest.bit_length() - 1
+        if on_step is not None:
+            labeled(vertices[vertex], label)
+        new_weights = 0
+        if on_step is None:
+            for neighbor_label in neighbor_labels_at[depth]:
+                new_weights |= 1 << (label + neighbor_label)
+        else:
+            for u, neighbor_label in zip(predecessors[depth], neighbor_labels_at[depth]):
+                weight = label + neighbor_label
+                weighed(vertices[vertex], vertices[u], weight)
+                new_weights |= 1 << weight
+        labels[vertex] = label
+        used_at[depth + 1] = used_at[depth] | new_weights
+        depth += 1
+        entering = True
+
+# Depths closest to the leaves are not memoized (keying costs more than re-search)
+MEMO_SKIP_LAST_LEVELS = 2
+
 
 class BranchAndBoundSolver:
     def __init__(self, n: int, on_step: Optional[Callable[["StepEvent"], None]] = None):
         self.n = n
-        self.adjacency_list = create_mongolian_tent_graph(n)
+        self.adjacency_list = _cached_tent_graph(n)
         self.on_step = on_step
         self.vertex_order = self._create_smart_vertex_order(n)
+        # Vertices are numbered by their position in the fixed order, so the
+        # recursive search keeps labels in a flat list indexed by depth
+        self._position = {v: i for i, v in enumerate(self.vertex_order)}
+        # Ids of the neighbors labeled before each vertex in the fixed order
+        self._predecessors = [
+            tuple(self._position[u] for u in self.adjacency_list[v] if self._position[u] < i)
+            for i, v in enumerate(self.vertex_order)
+        ]
+        self._frontiers = self._compute_frontiers()
+        # Subproblems proven infeasible for the current k (cleared per k)
+        self._failed_states: set = set()
+        self._memo_depth_limit = len(self.vertex_order) - MEMO_SKIP_LAST_LEVELS
+
+    def _compute_frontiers(self) -> List[Tuple[int, ...]]:
+        """For each depth, the ids of labeled vertices that still have unlabeled neighbors.
+
+        Only their labels (plus the used weights) constrain the rest of the
+        search, so they identify the remaining subproblem exactly.
+        """
+        position = self._position
+        frontiers = []
+        for depth in range(len(self.vertex_order) + 1):
+            frontiers.append(tuple(
+                i for i, v in enumerate(self.vertex_order[:depth])
+                if any(position[u] >= depth for u in self.adjacency_list[v])
+            ))
+        return frontiers
 
     def _create_smart_vertex_order(self, n: int) -> List[Any]:
         # Apex vertex 'x'
@@ -260,93 +368,140 @@ class BranchAndBoundSolver:
             vertex_order.append((1, j))
         return vertex_order
 
-    def _is_assignment_valid(self, current_v: Any, labels: Dict[Any, int], used_edge_weights: set[int]) -> Tuple[bool, set[int]]:
-        newly_formed_weights = set()
-        current_label = labels[current_v]
-
-        for neighbor in self.adjacency_list[current_v]:
-            if neighbor in labels:  # If neighbor is already labeled
-                weight = current_label + labels[neighbor]
-                if weight in used_edge_weights or weight in newly_formed_weights:
-                    return False, set()  # Conflict found
-                newly_formed_weights.add(weight)
-        return True, newly_formed_weights
-
-    def _solve_recursive(self, v_idx: int, k: int, labels: Dict[Any, int], used_weights: set[int]) -> Optional[Dict[Any, int]]:
+    def _is_assignment_valid(self, v_idx: int, label: int, labels: List[int], used_mask: int) -> Tuple[bool, int]:
+        """Check ``label`` for vertex id v_idx against its labeled predecessors.
+
+        Weights are bitmasks (bit w set = weight w taken). Returns whether no
+        new weight collides with used_mask or another new weight, and the mask
+        of the newly formed weights (0 on conflict).
+        """
+        new_mask = 0
+        for u in self._predecessors[v_idx]:
+            bit = 1 << (label + labels[u])
+            if (used_mask | new_mask) & bit:
+                return False, 0  # Conflict found
+            new_mask |= bit
+        return True, new_mask
+
+    def _solve_recursive(self, v_idx: int, k: int, labels: List[int], used_mask: int = 0) -> Optional[List[int]]:
+        """Label vertex ids v_idx.. in order; labels[i] is the label of vertex_order[i]."""
         if v_idx == len(self.vertex_order):
             return labels  # All vertices labeled, solution found
 
-        current_v = self.vertex_order[v_idx]
-
-        for label in range(1, k + 1):
-            labels[current_v] = label
-            is_valid, newly_formed_weights = self._is_assignment_valid(current_v, labels, used_weights)
-
+        # Redundancy pruning: an identical subproblem already failed at this depth.
+        # Used weights are a bitmask (bit w set = weight w taken), a cheap hashable key.
+        # The last levels are cheaper to re-search than to key, so they are skipped.
+        state = None
+        if v_idx < self._memo_depth_limit:
+            state = (v_idx, tuple([labels[v] for v in self._frontiers[v_idx]]), used_mask)
+            if state in self._failed_states:
+                return None
+
+        # Reflection symmetry (l -> k + 1 - l): the first vertex needs only the lower half
+        top = k if v_idx else (k + 1) // 2
+        for label in range(1, top + 1):
+            is_valid, new_mask = self._is_assignment_valid(v_idx, label, labels, used_mask)
             if is_valid:
-                # Add newly formed weights to the set for the recursive call
-                updated_used_weights = used_weights.union(newly_formed_weights)
-                result = self._solve_recursive(v_idx + 1, k, labels, updated_used_weights)
+                labels[v_idx] = label
+                result = self._solve_recursive(v_idx + 1, k, labels, used_mask | new_mask)
                 if result is not None:
                     return result  # Solution found
+                # Backtrack: the weights live only in this frame's mask, and
+                # labels[v_idx] is overwritten before anything reads it again
 
-            # Backtrack: remove the current label and newly formed weights
-            del labels[current_v]
-            # No need to remove from used_weights as we pass a new set to recursive calls
-
+        if state is not None:
+            self._failed_states.add(state)
         return None
 
+    def _primal_incumbent(self, k_min: int) -> Tuple[Optional[int], Optional[Dict[Any, int]]]:
+        """Cheap randomized greedy run for an upper bound (incumbent) on es."""
+        order = dsatur_order(self.adjacency_list)
+        for k in range(k_min, k_min + PRIMAL_HEURISTIC_K_SLACK + 1):
+            labeling = greedy_k_labeling(
+                self.adjacency_list, k, attempts=PRIMAL_HEURISTIC_ATTEMPTS, vertex_order=order
+            )
+            if labeling is not None:
+                return k, labeling
+        return None, None
+
+    def _solve_for_k(self, k: int) -> Optional[Dict[Any, int]]:
+        """Exact search for a fixed k.
+
+        Uses the Numba-compiled kernel of the edge-irregular solver with this
+        solver's vertex order when it is available (imported lazily, as it
+        loads numba). Without numba, _solve_recursive is the fallback: its
+        failed-subproblem memo (_frontiers, _failed_states) only serves that
+        path and is cleared around each k.
+        """
+        from src.edge_irregular_solver import jit_kernel_available, k_labeling_fixed_order
+        if jit_kernel_available():
+            return k_labeling_fixed_order(self.adjacency_list, self.vertex_order, k)
+
+        self._failed_states.clear()
+        labels = self._solve_recursive(0, k, [0] * len(self.vertex_order))
+        self._failed_states.clear()
+        return None if labels is None else dict(zip(self.vertex_order, labels))
+
     def find_es(self) -> Tuple[Optional[int], Optional[Dict[Any, int]]]:
         k_min = calculate_lower_bound(self.n)
         k = k_min
 
-        while True:
+        # Non-improving pruning: no k at or above the incumbent needs an exact search
+        best_k, best_labeling = self._primal_incumbent(k_min)
+
+        while best_k is None or k < best_k:
             print(f"Attempting to find a valid labeling for k = {k} using Branch & Bound...")
-            labels: Dict[Any, int] = {}
-            used_edge_weights: set[int] = set()
-            
-            solution = self._solve_recursive(0, k, labels, used_edge_weights)
+            solution = self._solve_for_k(k)
             
             if solution is not None:
                 print(f"Found a valid labeling for k = {k} using Branch & Bound.")
                 return k, solution
             k += 1
 
-def find_optimal_k_labeling_circulant(
-    n: int,
-    r: int,
-    *,
-    on_step: Optional[Callable[["StepEvent"], None]] = None,
-    on_event: Optional[Callable[["StepEvent"], None]] = None,
-) -> Tuple[Optional[int], Optional[Dict[Any, int]]]:
-    """
-    Find the optimal (minimum) k and a valid labeling for a Circulant graph.
-    """
-    if n <= 0:
-        return None, None
+        # Every k below the incumbent is infeasible, so the incumbent is optimal
+        print(f"Found a valid labeling for k = {best_k} using Branch & Bound (primal heuristic incumbent).")
+        return best_k, best_labeling
 
-    adjacency_list = generate_circulant_graph(n, r)
-    if not adjacency_list: # Handle invalid circulant graph parameters
-        print(f"Invalid parameters for circulant graph: n={n}, r={r}")
-        return None, None
+def _generated_graph_lower_bound(adjacency_list: Mapping[Any, Tuple[Any, ...]]) -> int:
+    """
+    Counting, degree and coloring bound of the graph itself (see edge_irregular_lower_bound).
 
-    vertices = sorted(adjacency_list.keys(), key=_get_generic_vertex_sort_key, reverse=True) # Sort for consistent behavior
-    
-    # Determine a reasonable lower bound for circulant graphs.
-    # This might need to be refined based on graph properties.
-    # For now, a simple lower bound could be based on max degree or a small constant.
-    # For circulant graphs, the degree is (n-1) for K_n, or (n-6) for the modified one.
-    # A simple lower bound could be max_degree + 1, or 1 if no edges.
-    k = calculate_circulant_lower_bound(n, r) # Use the theoretical lower bound
+    calculate_circulant_lower_bound is a closed form in n and r, while
+    generate_circulant_graph ignores r, so on the generated graph it can sit
+    well below these (C(12): 4 against 19).
+    """
+    # Imported lazily, as the module loads numba
+    from src.edge_irregular_solver import edge_irregular_lower_bound
+    return edge_irregular_lower_bound(adjacency_list)
 
-    while True:
-        print(f"Attempting to find a valid labeling for k = {k} for Circulant graph C({n}, {r})...")
-        used_weights = _init_used_weights(2 * k + 1)
-        callback = on_event if on_event is not None else on_step
-        labeling = _backtrack_k_labeling_generic(adjacency_list, k, {}, vertices, used_weights, callback)
-        if labeling is not None and is_labeling_valid(adjacency_list, labeling, sort_key_func=_get_generic_vertex_sort_key):
-            print(f"Found a valid labeling for k = {k} for Circulant graph C({n}, {r}).")
-            return k, labeling
-        k += 1
+def _least_feasible_k(solve: Callable[[int], Optional[Dict[Any, int]]], lower_bound: int) -> Tuple[int, Dict[Any, int]]:
+    """
+    Smallest k >= ``lower_bound`` for which ``solve(k)`` returns a labeling, and that labeling.
+
+    A labeling with labels up to k is also one for k + 1, so feasibility is
+    monotone in k. The probes gallop up from the bound (lower_bound, +1, +3,
+    +7, ...) until one succeeds and then bisect back to the last failure.
+    Proving a k infeasible is the expensive search, and this takes
+    O(log gap) of them instead of one per k below the optimum; a tight
+    bound still succeeds on the first probe.
+    """
+    last_infeasible = lower_bound - 1
+    k = lower_bound
+    step = 1
+    labeling = solve(k)
+    while labeling is None:
+        last_infeasible = k
+        k += step
+        step *= 2
+        labeling = solve(k)
+    while k - last_infeasible > 1:
+        mid = (last_infeasible + k) // 2
+        smaller = solve(mid)
+        if smaller is None:
+            last_infeasible = mid
+        else:
+            k, labeling = mid, smaller
+    return k, labeling
 
 def find_optimal_k_labeling_circulant(
     n: int,
@@ -361,29 +516,31 @@ def find_optimal_k_labeling_circulant(
     if n <= 0:
         return None, None
 
-    adjacency_list = generate_circulant_graph(n, r)
+    adjacency_list = _cached_circulant_graph(n, r)
     if not adjacency_list: # Handle invalid circulant graph parameters
         print(f"Invalid parameters for circulant graph: n={n}, r={r}")
         return None, None
 
-    vertices = sorted(adjacency_list.keys(), key=_get_generic_vertex_sort_key, reverse=True) # Sort for consistent behavior
+    vertices = dsatur_order(adjacency_list)  # Most-constrained vertex first
     
     # Determine a reasonable lower bound for circulant graphs.
     # This might need to be refined based on graph properties.
     # For now, a simple lower bound could be based on max degree or a small constant.
     # For circulant graphs, the degree is (n-1) for K_n, or (n-6) for the modified one.
     # A simple lower bound could be max_degree + 1, or 1 if no edges.
-    k = calculate_circulant_lower_bound(n, r) # Use the theoretical lower bound
+    # Use the theoretical lower bound, tightened by the graph's own bounds
+    lower_bound = max(calculate_circulant_lower_bound(n, r), _generated_graph_lower_bound(adjacency_list))
+    callback = on_event if on_event is not None else on_step
 
-    while True:
+    def solve(k: int) -> Optional[Dict[Any, int]]:
         print(f"Attempting to find a valid labeling for k = {k} for Circulant graph C({n}, {r})...")
-        used_weights = _init_used_weights(2 * k + 1)
-        callback = on_event if on_event is not None else on_step
-        labeling = _backtrack_k_labeling_generic(adjacency_list, k, {}, vertices, used_weights, callback)
-        if labeling is not None and is_labeling_valid(adjacency_list, labeling, sort_key_func=_get_generic_vertex_sort_key):
-            print(f"Found a valid labeling for k = {k} for Circulant graph C({n}, {r}).")
-            return k, labeling
-        k += 1
+        return _backtrack_k_labeling_generic(adjacency_list, k, {}, vertices, 0, callback)
+
+    k, labeling = _least_feasible_k(solve, lower_bound)
+    # The weight mask already rules out duplicates; the re-scan is a debug check (skipped under -O)
+    assert is_labeling_valid(adjacency_list, labeling)
+    print(f"Found a valid labeling for k = {k} for Circulant graph C({n}, {r}).")
+    return k, labeling
 
 def find_optimal_k_labeling(
     graph_type: str,
@@ -414,7 +571,7 @@ def find_optimal_k_labeling(
         tent_size = graph_params.get("n")
         if tent_size is None or tent_size <= 0:
             return None, None
-        adjacency_list = create_mongolian_tent_graph(tent_size)
+        adjacency_list = _cached_tent_graph(tent_size)
         lower_bound = calculate_lower_bound(tent_size)
         graph_description = f"Mongolian Tent graph (n={tent_size})"
     elif graph_type == "circulant":
@@ -422,33 +579,242 @@ def find_optimal_k_labeling(
         r = graph_params.get("r")
         if n is None or r is None or n <= 0 or r <= 0:
             return None, None
-        adjacency_list = generate_circulant_graph(n, r)
+        adjacency_list = _cached_circulant_graph(n, r)
         if not adjacency_list: # Handle invalid circulant graph parameters
             print(f"Invalid parameters for circulant graph: n={n}, r={r}")
             return None, None
-        lower_bound = calculate_circulant_lower_bound(n, r)
+        lower_bound = max(calculate_circulant_lower_bound(n, r), _generated_graph_lower_bound(adjacency_list))
         graph_description = f"Circulant graph C({n}, {r})"
     else:
         raise ValueError(f"Unsupported graph type: {graph_type}")
 
-    # Sort vertices for consistent behavior in backtracking
-    if graph_type == "circulant":
-        vertices = sorted(adjacency_list.keys()) # Circulant graphs often benefit from natural vertex order
-    else:
-        vertices = sorted(adjacency_list.keys(), key=lambda v: len(adjacency_list[v]), reverse=True)
+    # Most-constrained vertex first (see dsatur_order). The backtracking labels
+    # in this fixed order, so the saturation of every candidate is known up
+    # front and a static order equals picking the vertex dynamically.
+    vertices = dsatur_order(adjacency_list)
+    callback = on_event if on_event is not None else on_step
 
-    k = lower_bound
-
-    while True:
+    def solve(k: int) -> Optional[Dict[Any, int]]:
         print(f"Attempting to find a valid labeling for k = {k} for {graph_description}...")
-        # Start backtracking with a bit-array mask for possible edge weights (0..2*k)
-        used_weights = _init_used_weights(2 * k + 1)
-        callback = on_event if on_event is not None else on_step
-        labeling = _backtrack_k_labeling_generic(adjacency_list, k, {}, vertices, used_weights, callback)
-        if labeling is not None and is_labeling_valid(adjacency_list, labeling, sort_key_func=_get_generic_vertex_sort_key):
-            print(f"Found a valid labeling for k = {k} for {graph_description}.")
-            return k, labeling
-        k += 1
+        # Start backtracking with no edge weight taken (int bitmask, bit w = weight w)
+        return _backtrack_k_labeling_generic(adjacency_list, k, {}, vertices, 0, callback)
+
+    k, labeling = _least_feasible_k(solve, lower_bound)
+    assert is_labeling_valid(adjacency_list, labeling)
+    print(f"Found a valid labeling for k = {k} for {graph_description}.")
+    return k, labeling
+
+def dsatur_order(adjacency_list: Dict[Any, List[Any]]) -> List[Any]:
+    """Return a DSatur-style vertex sequence for the greedy heuristics.
+
+    Each step picks the unordered vertex with the most already-ordered
+    neighbors (every labeled neighbor adds an edge-weight constraint, the
+    analogue of colour saturation), breaking ties by degree. The order only
+    depends on the structure, so it is computed once and reused across k.
+    """
+    degrees = {v: len(neighbors) for v, neighbors in adjacency_list.items()}
+    saturation = dict.fromkeys(adjacency_list, 0)
+    order: List[Any] = []
+    remaining = set(adjacency_list)
+    # Ties beyond saturation/degree fall back to insertion order for determinism
+    position = {v: i for i, v in enumerate(adjacency_list)}
+    while remaining:
+        vertex = max(remaining, key=lambda v: (saturation[v], degrees[v], -position[v]))
+        remaining.remove(vertex)
+        order.append(vertex)
+        for neighbor in adjacency_list[vertex]:
+            if neighbor in remaining:
+                saturation[neighbor] += 1
+    return order
+
+
+def _greedy_attempt(
+    neighbor_ids: List[List[int]],
+    order: List[int],
+    k_upper_bound: int,
+    backjumps_allowed: int,
+    rng: Any,
+) -> Tuple[Optional[List[int]], Optional[int]]:
+    """One greedy attempt over vertex ids in ``order``.
+
+    Returns ``(labels, None)`` on success, with ``labels`` indexed by vertex id,
+    or ``(None, vertex)`` naming the vertex that could not be labeled. ``rng``
+    (the ``random`` module or a ``random.Random``) breaks ties between labels.
+    """
+    labels = [0] * len(neighbor_ids)
+    # Taken weights are kept twice: as flags for the sliding conflict scores
+    # (one spare slot past weight 2k) and as an int bitmask (bit w = weight w). Bit i of a neighbor's window
+    # (used >> (ln + 1), cut to k bits) marks label i + 1 as colliding with it.
+    used_weights = [False] * (2 * k_upper_bound + 2)
+    used = 0
+    window_mask = (1 << k_upper_bound) - 1
+    vertex_index = 0
+    backjumps = 0
+
+    while vertex_index < len(order):
+        vertex = order[vertex_index]
+        neighbors = neighbor_ids[vertex]
+        
+        # Find the best label using conflict minimization. Ties are broken by
+        # one random pick among the best labels, which is distributed like
+        # taking the first of them in a shuffled label order.
+        best_labels: List[int] = []
+        min_conflict_score = float('inf')
+        conflict_set = set()
+
+        # One shift per labeled neighbor collects the forbidden labels; a
+        # neighbor belongs to the conflict set when it forbids any label.
+        # Two labeled neighbors with equal labels would repeat a weight
+        # whatever the label, so they forbid every label.
+        forbidden = 0
+        seen = 0
+        unassigned = 0
+        for neighbor in neighbors:
+            neighbor_label = labels[neighbor]
+            if not neighbor_label:
+                unassigned += 1
+                continue
+            if seen >> neighbor_label & 1:
+                forbidden = window_mask
+                conflict_set.add(neighbor)
+                continue
+            seen |= 1 << neighbor_label
+            window = used >> (neighbor_label + 1) & window_mask
+            if window:
+                forbidden |= window
+                conflict_set.add(neighbor)
+
+        # Score label 1, then slide the window of used weights along the
+        # labels instead of building a prefix list for every vertex.
+        conflict_score = _calculate_conflict_score(1, unassigned, used, k_upper_bound)
+        for label in range(1, k_upper_bound + 1):
+            if not forbidden >> (label - 1) & 1:
+                if conflict_score < min_conflict_score:
+                    min_conflict_score = conflict_score
+                    best_labels = [label]
+                elif conflict_score == min_conflict_score:
+                    best_labels.append(label)
+            if unassigned:
+                conflict_score += unassigned * (
+                    used_weights[label + k_upper_bound + 1] - used_weights[label + 1]
+                )
+
+        if best_labels:
+            best_label = best_labels[0] if len(best_labels) == 1 else rng.choice(best_labels)
+            labels[vertex] = best_label
+            for neighbor in neighbors:
+                if labels[neighbor]:
+                    weight = best_label + labels[neighbor]
+                    used_weights[weight] = True
+                    used |= 1 << weight
+            vertex_index += 1
+        else:
+            # Backjump logic
+            if backjumps < backjumps_allowed and conflict_set:
+                # Find the most recently labeled vertex in the conflict set
+                jump_target_index = -1
+                for i in range(vertex_index - 1, -1, -1):
+                    if order[i] in conflict_set:
+                        jump_target_index = i
+                        break
+                
+                if jump_target_index != -1:
+                    # Unlabel vertices from current back to jump target
+                    for i in range(jump_target_index + 1, vertex_index + 1):
+                        v_to_unlabel = order[i]
+                        if labels[v_to_unlabel]:
+                            # Un-mark weights
+                            for neighbor in neighbor_ids[v_to_unlabel]:
+                                if labels[neighbor] and neighbor != v_to_unlabel:
+                                    weight = labels[v_to_unlabel] + labels[neighbor]
+                                    used_weights[weight] = False
+                                    used &= ~(1 << weight)
+                            labels[v_to_unlabel] = 0
+                    
+                    vertex_index = jump_target_index
+                    backjumps += 1
+                    continue
+
+            # If backjump fails or not allowed, fail the attempt
+            return None, vertex
+
+    return labels, None
+
+
+# Neighbor lists of the graph handed to each pool worker once (see _init_greedy_worker)
+_worker_neighbor_ids: List[List[int]] = []
+
+
+def _init_greedy_worker(neighbor_ids: List[List[int]]) -> None:
+    global _worker_neighbor_ids
+    _worker_neighbor_ids = neighbor_ids
+
+
+def _seeded_greedy_attempts(
+    order: List[int],
+    shuffle_order: bool,
+    k_upper_bound: int,
+    backjumps_allowed: int,
+    seeds: List[int],
+) -> Optional[List[int]]:
+    """Run one attempt per seed in a pool worker; return the first complete labeling."""
+    for seed in seeds:
+        rng = random.Random(seed)
+        attempt_order = list(order)
+        if shuffle_order:
+            rng.shuffle(attempt_order)
+        labels, _failed = _greedy_attempt(_worker_neighbor_ids, attempt_order, k_upper_bound, backjumps_allowed, rng)
+        if labels is not None:
+            return labels
+    return None
+
+
+def _greedy_pool(neighbor_ids: List[List[int]], max_workers: int) -> ProcessPoolExecutor:
+    """Process pool whose workers hold the graph's ``neighbor_ids`` (see _init_greedy_worker)."""
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=_init_greedy_worker, initargs=(neighbor_ids,))
+
+
+def _neighbor_id_lists(adjacency_list: Dict[Any, List[Any]]) -> List[List[int]]:
+    """Neighbor ids per vertex, ids following the adjacency-list order."""
+    vertex_ids = {v: i for i, v in enumerate(adjacency_list)}
+    return [[vertex_ids[w] for w in neighbors] for neighbors in adjacency_list.values()]
+
+
+def _greedy_attempts_parallel(
+    executor: ProcessPoolExecutor,
+    order: List[int],
+    shuffle_order: bool,
+    k_upper_bound: int,
+    attempts: int,
+    backjumps_allowed: int,
+    max_workers: int,
+) -> Optional[List[int]]:
+    """
+    Spread independent greedy attempts over a process pool; first success wins.
+
+    ``executor`` comes from _greedy_pool for the same graph. Attempt seeds are
+    drawn from the ``random`` module, so seeding it still makes the set of
+    attempts reproducible. Batches of seeds amortize the per-task overhead;
+    once a labeling is found the batches not yet started are cancelled, and
+    the pool stays up for the caller's next k.
+    """
+    seeds = [random.getrandbits(64) for _ in range(attempts)]
+    batch = max(1, attempts // (4 * max_workers))
+    futures = [
+        executor.submit(_seeded_greedy_attempts, order, shuffle_order, k_upper_bound, backjumps_allowed,
+                        seeds[start:start + batch])
+        for start in range(0, attempts, batch)
+    ]
+    try:
+        for future in as_completed(futures):
+            labels = future.result()
+            if labels is not None:
+                return labels
+        return None
+    finally:
+        for future in futures:
+            future.cancel()
+
 
 def greedy_k_labeling(
     adjacency_list: Dict[Any, List[Any]],
@@ -460,23 +826,74 @@ def greedy_k_labeling(
     failure_counts: Optional[Dict[Any, int]] = None,
     backjumps_allowed: int = 3,
     graph_type: str = "mongolian_tent", # Added graph_type parameter
+    vertex_order: Optional[List[Any]] = None,
+    max_workers: int = 1,
+    executor: Optional[ProcessPoolExecutor] = None,
 ) -> Optional[Dict[Any, int]]:
     """A more robust greedy solver that makes multiple randomized attempts.
 
+    When ``vertex_order`` is given it is used for every attempt and only the
+    label choices are randomized.
+
+    An attempt never takes a label that repeats a weight, so a returned
+    labeling is valid and callers need not check it again.
+
+    With ``max_workers > 1`` and at least PARALLEL_GREEDY_MIN_ATTEMPTS
+    attempts, the attempts run in a process pool. This does not apply with
+    ``failure_counts``, because each attempt there learns from the previous ones.
+    Callers that try many k on one graph pass ``executor``, a pool from
+    _greedy_pool(_neighbor_id_lists(adjacency_list), max_workers), so the
+    workers start once; otherwise each call starts and stops its own pool.
+
     References:
         - ai-docs/algorithms/heuristic_algorithm.md (multi-attempt heuristic)
         - ai-docs/fixes/fix_greedy_inefficiency.md (shuffle and attempt count tuning)
     """
-    import random
-
     # Pre-calculate degrees for sorting if using failure counts
     degrees = {}
     if failure_counts is not None:
         degrees = {v: len(neighbors) for v, neighbors in adjacency_list.items()}
 
+    # Intern vertices once: labels live in a dense list indexed by vertex id
+    # (0 = unlabeled), so the inner loops never hash tuple vertex keys.
+    vertex_list = list(adjacency_list)
+    vertex_ids = {v: i for i, v in enumerate(vertex_list)}
+    neighbor_ids = _neighbor_id_lists(adjacency_list)
+
+    if max_workers > 1 and attempts >= PARALLEL_GREEDY_MIN_ATTEMPTS and failure_counts is None:
+        if vertex_order is not None:
+            vertices = list(vertex_order)
+        elif graph_type == "circulant":
+            vertices = sorted(adjacency_list.keys())
+        else:
+            vertices = vertex_list
+        shuffle_order = vertex_order is None and graph_type != "circulant"
+        pool = executor if executor is not None else _greedy_pool(neighbor_ids, max_workers)
+        try:
+            labels = _greedy_attempts_parallel(
+                pool, [vertex_ids[v] for v in vertices], shuffle_order,
+                k_upper_bound, attempts, backjumps_allowed, max_workers,
+            )
+        finally:
+            if pool is not executor:
+                pool.shutdown(wait=False, cancel_futures=True)
+        if labels is None:
+            return None
+        vertex_labels = dict(zip(vertex_list, labels))
+        assert is_labeling_valid(adjacency_list, vertex_labels, vertex_ids=vertex_ids)
+        return vertex_labels
+
+    # Fixed orders do not change between attempts, so map them to ids once
+    fixed_order = None
+    if vertex_order is not None:
+        fixed_order = [vertex_ids[v] for v in vertex_order]
+    elif graph_type == "circulant":
+        # Circulant graphs often benefit from natural vertex order
+        fixed_order = [vertex_ids[v] for v in sorted(adjacency_list.keys())]
+
     for _ in range(attempts):
-        if graph_type == "circulant":
-            vertices = sorted(adjacency_list.keys()) # Circulant graphs often benefit from natural vertex order
+        if fixed_order is not None:
+            order = fixed_order
         else: # Default for mongolian_tent and other graphs
             vertices = list(adjacency_list.keys())
             if failure_counts is not None:
@@ -484,84 +901,16 @@ def greedy_k_labeling(
                 vertices.sort(key=lambda v: (failure_counts.get(v, 0), degrees.get(v, 0)), reverse=True)
             else:
                 random.shuffle(vertices)
+            order = [vertex_ids[v] for v in vertices]
 
-        vertex_labels: dict = {}
-        used_weights = [False] * (2 * k_upper_bound + 1)
-        vertex_index = 0
-        backjumps = 0
-
-        while vertex_index < len(vertices):
-            vertex = vertices[vertex_index]
-            
-            # Find the best label using conflict minimization
-            best_label = -1
-            min_conflict_score = float('inf')
-            conflict_set = set()
-
-            possible_labels = list(range(1, k_upper_bound + 1))
-            random.shuffle(possible_labels)
-
-            for label in possible_labels:
-                is_valid_label = True
-                current_conflict_set = set()
-                for neighbor in adjacency_list[vertex]:
-                    if neighbor in vertex_labels:
-                        weight = label + vertex_labels[neighbor]
-                        if used_weights[weight]:
-                            is_valid_label = False
-                            current_conflict_set.add(neighbor)
-                
-                if is_valid_label:
-                    conflict_score = _calculate_conflict_score(
-                        label, vertex, adjacency_list, vertex_labels, used_weights, k_upper_bound
-                    )
-                    if conflict_score < min_conflict_score:
-                        min_conflict_score = conflict_score
-                        best_label = label
-                else:
-                    conflict_set.update(current_conflict_set)
-
-            if best_label != -1:
-                vertex_labels[vertex] = best_label
-                for neighbor in adjacency_list[vertex]:
-                    if neighbor in vertex_labels:
-                        weight = best_label + vertex_labels[neighbor]
-                        used_weights[weight] = True
-                vertex_index += 1
-            else:
-                # Backjump logic
-                if backjumps < backjumps_allowed and conflict_set:
-                    # Find the most recently labeled vertex in the conflict set
-                    jump_target_index = -1
-                    for i in range(vertex_index - 1, -1, -1):
-                        if vertices[i] in conflict_set:
-                            jump_target_index = i
-                            break
-                    
-                    if jump_target_index != -1:
-                        # Unlabel vertices from current back to jump target
-                        for i in range(jump_target_index + 1, vertex_index + 1):
-                            v_to_unlabel = vertices[i]
-                            if v_to_unlabel in vertex_labels:
-                                # Un-mark weights
-                                for neighbor in adjacency_list[v_to_unlabel]:
-                                    if neighbor in vertex_labels and neighbor != v_to_unlabel:
-                                        weight = vertex_labels[v_to_unlabel] + vertex_labels[neighbor]
-                                        used_weights[weight] = False
-                                del vertex_labels[v_to_unlabel]
-                        
-                        vertex_index = jump_target_index
-                        backjumps += 1
-                        continue
-
-                # If backjump fails or not allowed, fail the attempt
-                if failure_counts is not None:
-                    failure_counts[vertex] += 1
-                break  # End this attempt
-
-        if len(vertex_labels) == len(vertices):
-            if is_labeling_valid(adjacency_list, vertex_labels, sort_key_func=_get_generic_vertex_sort_key):
-                return vertex_labels
+        labels, failed_vertex = _greedy_attempt(neighbor_ids, order, k_upper_bound, backjumps_allowed, random)
+        if labels is None:
+            if failure_counts is not None:
+                failure_counts[vertex_list[failed_vertex]] += 1
+            continue
+        vertex_labels = dict(zip(vertex_list, labels))
+        assert is_labeling_valid(adjacency_list, vertex_labels, vertex_ids=vertex_ids)
+        return vertex_labels
 
     return None
 
@@ -570,17 +919,36 @@ def greedy_k_labeling(
 # --------------------
 
 
+def _first_fit_vertex_order(adjacency_list: Dict[Any, List[Any]], graph_type: str) -> List[Any]:
+    """Vertex sequence used by _first_fit_greedy_k_labeling."""
+    if graph_type == "circulant":
+        return sorted(adjacency_list.keys()) # Circulant graphs often benefit from natural vertex order
+    # Order vertices by degree (high -> low) to maximize early pruning.
+    return sorted(adjacency_list.keys(), key=lambda v: len(adjacency_list[v]), reverse=True)
+
+
 def _first_fit_greedy_k_labeling(
     adjacency_list: Dict[Any, List[Any]],
     k_upper_bound: int,
     *,
     on_step: Optional[Callable[["StepEvent"], None]] = None,
     graph_type: str = "mongolian_tent", # Added graph_type parameter
+    vertex_order: Optional[List[Any]] = None,
+    resume_state: Optional[Dict[str, Any]] = None,
 ) -> Optional[Dict[Any, int]]:
     """A single-pass deterministic greedy solver.
 
     Vertices are processed in descending degree order and assigned the
-    smallest label that maintains edge weight uniqueness.
+    smallest label that maintains edge weight uniqueness. Callers that try
+    many k values pass that order in ``vertex_order`` (see
+    _first_fit_vertex_order) so it is not re-sorted on every call.
+
+    ``resume_state`` (a dict, initially empty) lets such callers keep the
+    work of a failed pass: on failure the labels, used weights and position
+    reached are stored there, and a later call with a larger k and the same
+    order continues from that vertex. The smallest free label of every
+    earlier vertex is the same for the larger k, so the result equals a
+    fresh pass. It is ignored when events are emitted.
 
     This trades potentially higher k values for much faster runtimes
     compared to the randomized multi-attempt heuristic.
@@ -589,49 +957,84 @@ def _first_fit_greedy_k_labeling(
         - ai-docs/enhancments/enhancement01_Task_2.md (fast heuristic concept)
     """
 
-    if graph_type == "circulant":
-        vertices = sorted(adjacency_list.keys()) # Circulant graphs often benefit from natural vertex order
-    else:
-        # Order vertices by degree (high -> low) to maximize early pruning.
-        vertices = sorted(adjacency_list.keys(), key=lambda v: len(adjacency_list[v]), reverse=True)
-
-    vertex_labels: Dict[Any, int] = {}
-    # Initialize used_weights bit-array for incremental conflict checks
-    used_weights = [False] * (2 * k_upper_bound + 1)
+    vertices = vertex_order if vertex_order is not None else _first_fit_vertex_order(adjacency_list, graph_type)
+
+    # Dense labels indexed by vertex id (0 = unlabeled) instead of a dict keyed by vertex
+    vertex_list = list(adjacency_list)
+    vertex_ids = {v: i for i, v in enumerate(vertex_list)}
+    labels = [0] * len(vertex_list)
+    if on_step is None:
+        # Nothing to animate: with used weights as an int bitmask, label l is
+        # free exactly when bit l of used >> ln is clear for every labeled
+        # neighbor label ln, so the first fit is the lowest clear bit in 1..k
+        label_bits = ((1 << k_upper_bound) - 1) << 1
+        used = 0
+        start = 0
+        if resume_state and resume_state["k"] <= k_upper_bound:
+            labels = resume_state["labels"]
+            used = resume_state["used"]
+            start = resume_state["index"]
+        for index in range(start, len(vertices)):
+            vertex = vertices[index]
+            neighbor_labels = [labels[vertex_ids[w]] for w in adjacency_list[vertex]]
+            forbidden = 0
+            seen = 0
+            for neighbor_label in neighbor_labels:
+                if neighbor_label:
+                    if seen >> neighbor_label & 1:
+                        forbidden = -1  # equal neighbor labels repeat a weight for any label
+                        break
+                    seen |= 1 << neighbor_label
+                    forbidden |= used >> neighbor_label
+            free = ~forbidden & label_bits
+            if not free:
+                if resume_state is not None:
+                    resume_state.update(k=k_upper_bound, labels=labels, used=used, index=index)
+                return None
+            label = (free & -free).bit_length() - 1
+            labels[vertex_ids[vertex]] = label
+            for neighbor_label in neighbor_labels:
+                if neighbor_label:
+                    used |= 1 << (label + neighbor_label)
+        if resume_state:
+            resume_state.clear()  # the saved labels list is now complete
+        return dict(zip(vertex_list, labels))
+
+    # Taken weights as an int bitmask (bit w = weight w) for incremental conflict checks
+    used = 0
+    # Events are only built when the animation module is available
+    emit = on_step if StepEvent and EventType else None
+    if emit is not None:
+        labeled, weighed, _backtracked = _step_emitters(emit)
     for vertex in vertices:
+        vertex_id = vertex_ids[vertex]
+        neighbor_ids = [vertex_ids[w] for w in adjacency_list[vertex]]
         assigned = False
         for label in range(1, k_upper_bound + 1):
-            temp_weights: List[int] = []
+            # New weights fold into one mask; a repeat among them (two
+            # neighbors with equal labels) is a conflict like a taken weight
+            new_weights = 0
             conflict = False
-            for neighbor in adjacency_list[vertex]:
-                if neighbor in vertex_labels:
-                    weight = label + vertex_labels[neighbor]
-                    if StepEvent and EventType:
-                        _maybe_emit(
-                            on_step,
-                            StepEvent(
-                                EventType.EDGE_WEIGHT_CALCULATED,
-                                {"edge": (vertex, neighbor), "weight": weight},
-                            ),
-                        )
-                    if used_weights[weight]:
+            for neighbor_id in neighbor_ids:
+                if labels[neighbor_id]:
+                    weight = label + labels[neighbor_id]
+                    if emit is not None:
+                        weighed(vertex, vertex_list[neighbor_id], weight)
+                    bit = 1 << weight
+                    if (used | new_weights) & bit:
                         conflict = True
                         break
-                    temp_weights.append(weight)
+                    new_weights |= bit
             if not conflict:
-                vertex_labels[vertex] = label
-                if StepEvent and EventType:
-                    _maybe_emit(
-                        on_step,
-                        StepEvent(EventType.VERTEX_LABELED, {"vertex": vertex, "label": label}),
-                    )
-                for w in temp_weights:
-                    used_weights[w] = True
+                labels[vertex_id] = label
+                if emit is not None:
+                    labeled(vertex, label)
+                used |= new_weights
                 assigned = True
                 break
         if not assigned:
             return None
-    return vertex_labels
+    return dict(zip(vertex_list, labels))
 
 def find_feasible_k_labeling(
     graph_type: str,
@@ -642,6 +1045,8 @@ def find_feasible_k_labeling(
     algorithm: str = "accurate",
     on_step: Optional[Callable[["StepEvent"], None]] = None,
     on_event: Optional[Callable[["StepEvent"], None]] = None,
+    vertex_order: Optional[List[Any]] = None,
+    max_workers: int = 1,
 ) -> Tuple[Optional[int], Optional[Dict[Any, int]]]:
     """
     Find a feasible k-labeling for a given graph using a heuristic search.
@@ -651,6 +1056,10 @@ def find_feasible_k_labeling(
         graph_params: A dictionary of parameters specific to the graph type (e.g., {"n": 5} for Mongolian Tent, {"n": 5, "r": 2} for Circulant).
         max_k_multiplier: multiplier to set an upper bound on k based on the lower bound.
         num_attempts: number of randomized greedy attempts per k value.
+        vertex_order: precomputed vertex sequence for the 'intelligent' heuristic;
+            defaults to dsatur_order() of the generated graph.
+        max_workers: processes for the independent randomized attempts of the
+            'intelligent' heuristic (see greedy_k_labeling).
 
     Returns:
         A tuple (k, labeling) with a valid labeling found, or (None, None) if none is found within bounds.
@@ -667,7 +1076,7 @@ def find_feasible_k_labeling(
         n = graph_params.get("n")
         if n is None or n <= 0:
             return None, None
-        adjacency_list = create_mongolian_tent_graph(n)
+        adjacency_list = _cached_tent_graph(n)
         lower_bound = calculate_lower_bound(n)
         graph_description = f"Mongolian Tent graph (n={n})"
     elif graph_type == "circulant":
@@ -675,7 +1084,7 @@ def find_feasible_k_labeling(
         r = graph_params.get("r")
         if n is None or r is None or n <= 0 or r <= 0:
             return None, None
-        adjacency_list = generate_circulant_graph(n, r)
+        adjacency_list = _cached_circulant_graph(n, r)
         if not adjacency_list: # Handle invalid circulant graph parameters
             print(f"Invalid parameters for circulant graph: n={n}, r={r}")
             return None, None
@@ -692,83 +1101,111 @@ def find_feasible_k_labeling(
 
     # Initialize failure counts for conflict-guided vertex ordering in 'accurate' mode
     failure_counts = {v: 0 for v in adjacency_list}
+    if algorithm == "intelligent" and vertex_order is None:
+        vertex_order = dsatur_order(adjacency_list)
+    # The first-fit order depends only on the graph, so sort once for all k
+    first_fit_order = _first_fit_vertex_order(adjacency_list, graph_type) if algorithm == "fast" else None
+    # A failed first-fit pass resumes at the next k from where it stopped
+    first_fit_state: Dict[str, Any] = {}
 
     print(
         f"\n[Heuristic Search] Starting search for {graph_description} from k={lower_bound} (limit: k={k_upper_bound}) using '{algorithm}' heuristic..."
     )
 
 
-    while k <= k_upper_bound:
-        if algorithm == "fast":
-            if k == lower_bound or k % 10 == 0:
-                print(f"Attempting fast greedy solve for k={k} (multi-pass)...")
+    # The intelligent search's parallel attempts share one pool across all k
+    executor = None
+    if algorithm == "intelligent" and max_workers > 1 and num_attempts >= PARALLEL_GREEDY_MIN_ATTEMPTS:
+        executor = _greedy_pool(_neighbor_id_lists(adjacency_list), max_workers)
+    try:
+        while k <= k_upper_bound:
+            if algorithm == "fast":
+                if k == lower_bound or k % 10 == 0:
+                    print(f"Attempting fast greedy solve for k={k} (multi-pass)...")
 
-            # 1) Deterministic first-fit pass (very quick)
-            callback = on_event if on_event is not None else on_step
-            labeling = _first_fit_greedy_k_labeling(adjacency_list, k, on_step=callback, graph_type=graph_type)
-            if labeling and is_labeling_valid(adjacency_list, labeling, sort_key_func=_get_generic_vertex_sort_key):
-                print(f"Fast heuristic found a valid labeling with k={k} for {graph_description} on deterministic pass.")
-                return k, labeling
+                # 1) Deterministic first-fit pass (very quick)
+                callback = on_event if on_event is not None else on_step
+                labeling = _first_fit_greedy_k_labeling(
+                    adjacency_list, k, on_step=callback, graph_type=graph_type, vertex_order=first_fit_order,
+                    resume_state=first_fit_state,
+                )
+                if labeling is not None:
+                    print(f"Fast heuristic found a valid labeling with k={k} for {graph_description} on deterministic pass.")
+                    return k, labeling
 
-            # 2) Limited randomized passes correlated to n to improve accuracy without large slowdown.
-            passes = max(2, min(10, n // 2))  # e.g., n=5 ⇒ 2 passes, n=20 ⇒ 10 passes cap.
-            for _ in range(passes):
+                # 2) Limited randomized passes correlated to n to improve accuracy without large slowdown.
+                passes = max(2, min(10, n // 2))  # e.g., n=5 ⇒ 2 passes, n=20 ⇒ 10 passes cap.
+                for _ in range(passes):
+                    callback = on_event if on_event is not None else on_step
+                    labeling = greedy_k_labeling(
+                        adjacency_list,
+                        k,
+                        attempts=1,
+                        on_event=callback,
+                        graph_type=graph_type,
+                    )
+                    if labeling is not None:  # greedy_k_labeling validates what it returns
+                        print(
+                            f"Fast heuristic found a valid labeling with k={k} for {graph_description} after randomized pass."
+                        )
+                        return k, labeling
+            elif algorithm == "intelligent":
+                if k == lower_bound or k % 10 == 0:
+                    print(f"Attempting DSatur-ordered greedy solve for k={k} ({num_attempts} attempts)...")
                 callback = on_event if on_event is not None else on_step
                 labeling = greedy_k_labeling(
                     adjacency_list,
                     k,
-                    attempts=1,
+                    attempts=num_attempts,
                     on_event=callback,
                     graph_type=graph_type,
+                    vertex_order=vertex_order,
+                    max_workers=max_workers,
+                    executor=executor,
                 )
-                if labeling and is_labeling_valid(adjacency_list, labeling, sort_key_func=_get_generic_vertex_sort_key):
-                    print(
-                        f"Fast heuristic found a valid labeling with k={k} for {graph_description} after randomized pass."
-                    )
+                if labeling is not None:
+                    print(f"Intelligent heuristic found a valid labeling with k={k} for {graph_description}.")
                     return k, labeling
-        else:  # accurate / default multi-attempt heuristic
-            if k == lower_bound or k % 10 == 0:
-                print(f"Attempting randomized greedy solve for k={k} ({num_attempts} attempts)...")
-            callback = on_event if on_event is not None else on_step
-            labeling = greedy_k_labeling(
-                adjacency_list,
-                k,
-                attempts=num_attempts,
-                on_event=callback,
-                failure_counts=failure_counts,
-                graph_type=graph_type,
-            )
-            if labeling and is_labeling_valid(adjacency_list, labeling, sort_key_func=_get_generic_vertex_sort_key):
-                print(f"Heuristic search found a valid labeling with k={k} for {graph_description}.")
-                return k, labeling
-        k += 1
-    print(
-        f"Heuristic search failed to find a solution for {graph_description} within the k limit (k>{k_upper_bound})."
-    )
-    return None, None
+            else:  # accurate / default multi-attempt heuristic
+                if k == lower_bound or k % 10 == 0:
+                    print(f"Attempting randomized greedy solve for k={k} ({num_attempts} attempts)...")
+                callback = on_event if on_event is not None else on_step
+                labeling = greedy_k_labeling(
+                    adjacency_list,
+                    k,
+                    attempts=num_attempts,
+                    on_event=callback,
+                    failure_counts=failure_counts,
+                    graph_type=graph_type,
+                )
+                if labeling is not None:
+                    print(f"Heuristic search found a valid labeling with k={k} for {graph_description}.")
+                    return k, labeling
+            k += 1
+        print(
+            f"Heuristic search failed to find a solution for {graph_description} within the k limit (k>{k_upper_bound})."
+        )
+        return None, None
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
 
 def _calculate_conflict_score(
     label: int,
-    vertex: Any,
-    adjacency_list: Dict[Any, List[Any]],
-    vertex_labels: Dict[Any, int],
-    used_weights: List[bool],
+    unassigned_neighbors: int,
+    used: int,
     k_upper_bound: int,
 ) -> int:
     """
     Calculates the conflict score for a potential label.
     The score is the sum of how many label choices are eliminated for all unassigned neighbors.
     A lower score is better.
+
+    A neighbor loses label m exactly when weight label + m is already used, so
+    every unassigned neighbor loses the same number of choices: the used
+    weights in label+1..label+k, counted on the bitmask ``used`` (bit w set =
+    weight w taken).
     """
-    conflict_score = 0
-    # For each unassigned neighbor, count how many of its potential labels would become invalid.
-    for neighbor in adjacency_list[vertex]:
-        if neighbor not in vertex_labels:  # Unassigned neighbor
-            # For this neighbor, iterate through all its possible labels
-            for neighbor_label in range(1, k_upper_bound + 1):
-                weight = label + neighbor_label
-                # If this weight is already used somewhere in the graph,
-                # then this `neighbor_label` is not a valid choice for `neighbor` anymore.
-                if weight < len(used_weights) and used_weights[weight]:
-                    conflict_score += 1
-    return conflict_score
\ No newline at end of file
+    if not unassigned_neighbors:
+        return 0
+    return unassigned_neighbors * (used >> (label + 1) & ((1 << k_upper_bound) - 1)).bit_count()
@@ -1,6 +1,5 @@
 """Visualization subpackage (animations, helpers)."""
 
-from .animation import AnimationController
 import importlib
 
 def visualize_k_labeling(*args, **kwargs):
@@ -8,7 +7,17 @@ def visualize_k_labeling(*args, **kwargs):
     mod = importlib.import_module("src.visualization.static")
     return getattr(mod, "visualize_k_labeling")(*args, **kwargs)
 
+def __getattr__(name):
+    """Import AnimationController (and matplotlib) only when it is first used.
+
+    Record mode only needs the recorder, so importing the package must not
+    pull in matplotlib before the solver runs.
+    """
+    if name == "AnimationController":
+        return importlib.import_module("src.visualization.animation").AnimationController
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "AnimationController",
     "visualize_k_labeling",
-] 
\ No newline at end of file
+]
@@ -1,12 +1,16 @@
-from typing import List
-from src.events import StepEvent
+from typing import List, Union
+from src.events import EventLog, StepEvent
 
 class EventRecorder:
-    """Records StepEvent instances into a provided buffer list."""
-    def __init__(self, buffer: List[StepEvent]) -> None:
+    """Records StepEvent instances into a provided buffer (a list or an EventLog).
+
+    Solvers that find an EventLog buffer write field values into it directly,
+    without building StepEvents.
+    """
+    def __init__(self, buffer: Union[List[StepEvent], EventLog]) -> None:
         self.buffer = buffer
 
     def __call__(self, event: StepEvent) -> None:
         self.buffer.append(event)
 
-__all__ = ["EventRecorder"] 
\ No newline at end of file
+__all__ = ["EventRecorder"]
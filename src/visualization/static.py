@@ -39,8 +39,7 @@ def visualize_k_labeling(
     solver_name: str | None = None,
 ) -> Path:
     if validate:
-        from src.labeling_solver import _get_generic_vertex_sort_key
-        assert is_labeling_valid(graph, labeling, sort_key_func=_get_generic_vertex_sort_key), "Labeling is not valid (duplicate edge weights)."
+        assert is_labeling_valid(graph, labeling), "Labeling is not valid (duplicate edge weights)."
 
     fmt = Path(output).suffix.lstrip(".") or "png"
     dest_path = Path(output)
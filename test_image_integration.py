@@ -55,6 +55,20 @@ def test_image_integration():
     return True
 
 
+def test_prefetch_matches_lazy_probing():
+    """Prefetched digests and sizes equal the ones probed on demand."""
+    prefetched = ImageIntegrator()
+    probed = prefetched.prefetch_images()
+    lazy = ImageIntegrator()
+    paths = [path for paths in prefetched.available_images.values() for path in paths]
+    assert probed == len(paths)
+    assert prefetched.prefetch_images() == 0
+    for path in paths:
+        assert prefetched._path_digests[path] == lazy._image_digest(path)
+        assert prefetched.get_image_size(path) == lazy.get_image_size(path)
+    assert lazy.get_image_size("graphs/does_not_exist.png") is None
+
+
 def test_report_generation_with_images():
     """Test report generation with image integration (without expensive benchmarks)."""
     print("\nTesting Report Generation with Images")
@@ -68,9 +82,9 @@ def test_report_generation_with_images():
     background_section = generator.generate_background()
     
     # Check if images were integrated
-    if "![" in background_section:
+    if "![" in background_section or "<img " in background_section:
         print("✓ Images successfully integrated into background section")
-        image_count = background_section.count("![")
+        image_count = background_section.count("![") + background_section.count("<img ")
         print(f"  Found {image_count} image references")
     else:
         print("⚠ No images found in background section")
@@ -79,13 +93,17 @@ def test_report_generation_with_images():
     print("Generating appendix section with image galleries...")
     appendix_section = generator.generate_appendix()
     
-    if "![" in appendix_section:
+    if "![" in appendix_section or "<img " in appendix_section:
         print("✓ Image galleries successfully integrated into appendix")
-        image_count = appendix_section.count("![")
+        image_count = appendix_section.count("![") + appendix_section.count("<img ")
         print(f"  Found {image_count} image references in galleries")
     else:
         print("⚠ No image galleries found in appendix")
     
+    # The integrator's running count matches the tags actually emitted
+    emitted = background_section.count("<img ") + appendix_section.count("<img ")
+    assert generator.image_integrator.emitted_count == emitted
+    
     # Save a sample section to file for inspection
     sample_filename = "sample_section_with_images.md"
     with open(sample_filename, 'w', encoding='utf-8') as f:
@@ -1,5 +1,9 @@
+import subprocess
+import sys
+from pathlib import Path
+
 from src.labeling_solver import find_feasible_k_labeling
-from src.events import EventType, StepEvent
+from src.events import EventLog, EventType, StepEvent
 from src.visualization.recorder import EventRecorder
 
 
@@ -37,4 +41,86 @@ def test_event_emission_count_small_graph():
     assert len(labeled_events) == expected_vertex_count, (
         f"number of VERTEX_LABELED events does not match vertices in final "
         f"solution ({len(labeled_events)} vs {expected_vertex_count})"
-    ) 
\ No newline at end of file
+    ) 
+
+
+def test_event_log_round_trips_recorded_events():
+    """An EventLog buffer replays exactly the events a plain list records."""
+    events: list[StepEvent] = []
+    log = EventLog(capacity=4)  # small capacity exercises the resize path
+    find_feasible_k_labeling(
+        "mongolian_tent", {"n": 3}, algorithm="fast", on_event=EventRecorder(events)
+    )
+    assert events, "solver emitted no events"
+    for event in events:
+        log.append(event)
+    events.append(StepEvent(EventType.EDGE_WEIGHT_CALCULATED, {"edge": ((1, 1), "x"), "weight": 7}, 1.5))
+    log.record(EventType.EDGE_WEIGHT_CALCULATED, (1, 1), neighbor="x", weight=7, timestamp=1.5)
+
+    assert len(log) == len(events)
+    assert list(log) == events
+    assert log[-1] == events[-1]
+
+
+def test_log_recorder_matches_list_recorder():
+    """Solvers writing field values straight into an EventLog record the same events as StepEvents in a list."""
+    from src import labeling_solver
+    from src.graph_generator import create_mongolian_tent_graph
+
+    graph = create_mongolian_tent_graph(3)
+    order = labeling_solver.dsatur_order(graph)
+    for solve in (
+        lambda recorder: labeling_solver._backtrack_k_labeling_generic(graph, 8, {}, order, 0, on_step=recorder),
+        lambda recorder: labeling_solver._first_fit_greedy_k_labeling(graph, 12, on_step=recorder),
+    ):
+        events: list[StepEvent] = []
+        log = EventLog()
+        assert solve(EventRecorder(events)) == solve(EventRecorder(log))
+        assert events
+        assert list(log) == events
+
+
+def test_callbacks_with_record_attribute_still_receive_step_events():
+    """Only a recorder over an EventLog takes raw fields; any other callback gets StepEvents."""
+    from unittest import mock
+    from src import labeling_solver
+    from src.graph_generator import create_mongolian_tent_graph
+
+    graph = create_mongolian_tent_graph(3)
+    callback = mock.MagicMock()
+    labeling_solver._first_fit_greedy_k_labeling(graph, 12, on_step=callback)
+    assert callback.call_count > 0
+    assert all(isinstance(call.args[0], StepEvent) for call in callback.call_args_list)
+    callback.record.assert_not_called()
+
+
+def test_event_log_reads_across_batched_flushes():
+    """Rows queued between flushes read back in order, including payloads kept on the side."""
+    from src.events import _FLUSH_EVENTS
+
+    log = EventLog(capacity=2)
+    events = []
+    for i in range(2 * _FLUSH_EVENTS + 5):
+        if i == _FLUSH_EVENTS + 1:
+            event = StepEvent(EventType.SOLUTION_FOUND, {"labels": {"x": 1}})
+        elif i % 2:
+            event = StepEvent(EventType.VERTEX_LABELED, {"vertex": (1, i % 7), "label": i})
+        else:
+            event = StepEvent(EventType.EDGE_WEIGHT_CALCULATED, {"edge": ("x", (2, i % 5)), "weight": i}, float(i))
+        events.append(event)
+        log.append(event)
+        if i == 3:
+            assert log[-1] == event  # a read before the first batch is full
+    assert len(log) == len(events)
+    assert list(log) == events
+
+
+def test_recorder_import_does_not_load_matplotlib():
+    """Record-mode setup imports only the recorder; matplotlib waits for the replay."""
+    code = (
+        "import sys\n"
+        "from src.visualization.recorder import EventRecorder\n"
+        "assert 'matplotlib' not in sys.modules\n"
+    )
+    repo_root = Path(__file__).resolve().parents[1]
+    subprocess.run([sys.executable, "-c", code], cwd=repo_root, check=True)
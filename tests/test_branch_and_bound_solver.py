@@ -1,5 +1,7 @@
 import unittest
-from src.labeling_solver import BranchAndBoundSolver
+from unittest import mock
+import src.edge_irregular_solver as edge_irregular_solver
+from src.labeling_solver import BranchAndBoundSolver, is_labeling_valid
 from src.graph_generator import create_mongolian_tent_graph
 from src.graph_properties import calculate_lower_bound
 
@@ -38,43 +40,31 @@ class TestBranchAndBoundSolver(unittest.TestCase):
         self.assertEqual(k, 8)
 
     def test_is_assignment_valid_mt31(self):
-        solver = BranchAndBoundSolver(1) # MT(3,1) graph
-        
-        # Test case 1: Labeling apex 'x' with 1
-        labels = {'x': 1}
-        used_weights = set()
-        is_valid, new_weights = solver._is_assignment_valid('x', labels, used_weights)
-        self.assertTrue(is_valid)
-        self.assertEqual(new_weights, set()) # No edges formed yet
-
-        # Test case 2: Labeling (3,1) with 2, after 'x' is labeled 1
-        labels = {'x': 1, (3,1): 2}
-        used_weights = set() # used_weights should be empty for this call, as it's passed from parent recursive call
-        is_valid, new_weights = solver._is_assignment_valid((3,1), labels, used_weights)
-        self.assertTrue(is_valid)
-        self.assertEqual(new_weights, {3}) # Edge ('x', (3,1)) has weight 1+2=3
-
-        # Test case 3: Labeling (2,1) with 3, after 'x':1, (3,1):2. Edge ('x', (3,1)) weight 3 is now in used_weights
-        labels = {'x': 1, (3,1): 2, (2,1): 3}
-        used_weights = {3} # Edge ('x', (3,1)) weight is already formed
-        is_valid, new_weights = solver._is_assignment_valid((2,1), labels, used_weights)
-        self.assertTrue(is_valid)
-        self.assertEqual(new_weights, {5}) # Edge ((3,1), (2,1)) has weight 2+3=5
-
-        # Test case 4: Labeling (1,1) with 4, after 'x':1, (3,1):2, (2,1):3. Edges ('x', (3,1)):3, ((3,1), (2,1)):5 are in used_weights
-        labels = {'x': 1, (3,1): 2, (2,1): 3, (1,1): 4}
-        used_weights = {3, 5}
-        is_valid, new_weights = solver._is_assignment_valid((1,1), labels, used_weights)
-        self.assertTrue(is_valid)
-        self.assertEqual(new_weights, {7}) # Edge ((2,1), (1,1)) has weight 3+4=7
-
-        # Test conflict: Label (2,1) with 1 (instead of 3). Edge ((3,1), (2,1)) weight 2+1=3. Conflict with existing 3.
-        labels_conflict = {'x': 1, (3,1): 2}
-        used_weights_conflict = {3} # From ('x', (3,1))
-        labels_conflict[(2,1)] = 1
-        is_valid, new_weights = solver._is_assignment_valid((2,1), labels_conflict, used_weights_conflict)
-        self.assertFalse(is_valid)
-        self.assertEqual(new_weights, set())
+        solver = BranchAndBoundSolver(1) # MT(3,1) graph: edges x-(1,1), (1,1)-(2,1), (2,1)-(3,1)
+        ids = solver._position
+        labels = [0] * len(solver.vertex_order)
+        labels[ids['x']] = 1
+        labels[ids[(3, 1)]] = 2
+
+        # Apex 'x' comes first: no labeled predecessors, no weights formed
+        self.assertEqual(solver._is_assignment_valid(ids['x'], 1, labels, 0), (True, 0))
+        # (3,1) is not adjacent to 'x', so it forms no weight either
+        self.assertEqual(solver._is_assignment_valid(ids[(3, 1)], 2, labels, 0), (True, 0))
+
+        # (2,1) labeled 3 forms weight 2+3=5 with (3,1)
+        self.assertEqual(solver._is_assignment_valid(ids[(2, 1)], 3, labels, 0), (True, 1 << 5))
+        labels[ids[(2, 1)]] = 3
+        used_mask = 1 << 5
+
+        # (1,1) labeled 4: weight 4+1=5 with 'x' is already used
+        self.assertEqual(solver._is_assignment_valid(ids[(1, 1)], 4, labels, used_mask), (False, 0))
+        # (1,1) labeled 1: weights 1+3=4 and 1+1=2 are new
+        self.assertEqual(solver._is_assignment_valid(ids[(1, 1)], 1, labels, used_mask),
+                         (True, (1 << 4) | (1 << 2)))
+
+        # Predecessors with equal labels repeat a weight among the new ones
+        labels[ids[(2, 1)]] = 1
+        self.assertEqual(solver._is_assignment_valid(ids[(1, 1)], 2, labels, 0), (False, 0))
 
     def test_adjacency_list_mt31(self):
         solver = BranchAndBoundSolver(1)
@@ -88,5 +78,64 @@ class TestBranchAndBoundSolver(unittest.TestCase):
         self.assertIn((1,1), adj[(2,1)])
         self.assertIn((2,1), adj[(1,1)])
 
+    def test_failed_states_memoized_for_infeasible_k(self):
+        solver = BranchAndBoundSolver(3)
+        # k = 7 is below es(MT(3,3)) = 8, so the whole tree fails and subproblems are recorded
+        self.assertIsNone(solver._solve_recursive(0, 7, [0] * len(solver.vertex_order)))
+        self.assertGreater(len(solver._failed_states), 0)
+        # Re-running with the memo populated prunes at the root immediately
+        self.assertIsNone(solver._solve_recursive(0, 7, [0] * len(solver.vertex_order)))
+
+    def test_frontiers_only_hold_labeled_vertices_with_open_neighbors(self):
+        solver = BranchAndBoundSolver(2)
+        for depth, frontier in enumerate(solver._frontiers):
+            unlabeled = set(solver.vertex_order[depth:])
+            for i in frontier:
+                self.assertLess(i, depth)
+                self.assertTrue(unlabeled.intersection(solver.adjacency_list[solver.vertex_order[i]]))
+
+    def test_incumbent_at_lower_bound_skips_exact_search(self):
+        solver = BranchAndBoundSolver(3)
+        incumbent = {'x': 1}
+        with mock.patch.object(solver, "_primal_incumbent", return_value=(calculate_lower_bound(3), incumbent)), \
+                mock.patch.object(solver, "_solve_for_k") as solve:
+            k, labeling = solver.find_es()
+        solve.assert_not_called()
+        self.assertEqual((k, labeling), (calculate_lower_bound(3), incumbent))
+
+    def test_incumbent_bounds_exact_scan(self):
+        solver = BranchAndBoundSolver(2)
+        # es(MT(3,2)) = 6 > lower bound 5: only k = 5 needs an exact search
+        labeling_inc = {'x': 6}
+        with mock.patch.object(solver, "_primal_incumbent", return_value=(6, labeling_inc)), \
+                mock.patch.object(solver, "_solve_for_k", wraps=solver._solve_for_k) as solve:
+            k, labeling = solver.find_es()
+        self.assertEqual(k, 6)
+        self.assertIs(labeling, labeling_inc)
+        solve.assert_called_once_with(calculate_lower_bound(2))
+
+    def test_recursive_fallback_without_numba(self):
+        solver = BranchAndBoundSolver(2)
+        with mock.patch.object(edge_irregular_solver, "_backtrack_kernel_jit", None), \
+                mock.patch.object(solver, "_primal_incumbent", return_value=(None, None)), \
+                mock.patch.object(solver, "_solve_recursive", wraps=solver._solve_recursive) as solve:
+            k, labeling = solver.find_es()
+        self.assertEqual(k, 6)
+        self.assertTrue(is_labeling_valid(solver.adjacency_list, labeling))
+        self.assertTrue(solve.called)
+        self.assertEqual(solver._failed_states, set())
+
+    def test_compiled_kernel_and_recursive_search_agree(self):
+        solver = BranchAndBoundSolver(2)
+        for k in (5, 6):
+            compiled = solver._solve_for_k(k)
+            with mock.patch.object(edge_irregular_solver, "_backtrack_kernel_jit", None):
+                recursive = solver._solve_for_k(k)
+            self.assertEqual(compiled is None, recursive is None)
+            for labeling in (compiled, recursive):
+                if labeling is not None:
+                    self.assertTrue(is_labeling_valid(solver.adjacency_list, labeling))
+                    self.assertLessEqual(max(labeling.values()), k)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,57 @@
+import unittest
+
+import networkx as nx
+
+from src.csr_graph import build_csr, csr_metrics, csr_edges, csr_eccentricity, csr_diameter
+from src.graph_generator import create_mongolian_tent_graph, generate_circulant_graph
+from src.graph_properties import calculate_graph_metrics
+
+
+class TestCSRGraph(unittest.TestCase):
+
+    def test_build_csr_mongolian_tent(self):
+        """CSR rows reproduce the adjacency lists in order"""
+        graph = create_mongolian_tent_graph(3)
+        vertices, indptr, indices = build_csr(graph)
+        self.assertEqual(vertices, list(graph))
+        self.assertEqual(len(indptr), len(graph) + 1)
+        for i, v in enumerate(vertices):
+            self.assertEqual([vertices[j] for j in indices[indptr[i]:indptr[i + 1]]], graph[v])
+
+    def test_metrics_match_adjacency_list(self):
+        for graph in (create_mongolian_tent_graph(5), generate_circulant_graph(12, 5), {}):
+            with self.subTest(size=len(graph)):
+                _vertices, indptr, _indices = build_csr(graph)
+                self.assertEqual(csr_metrics(indptr), calculate_graph_metrics(graph))
+
+    def test_edges_match_networkx(self):
+        graph = generate_circulant_graph(10, 5)
+        edges = {frozenset(e) for e in csr_edges(*build_csr(graph))}
+        self.assertEqual(edges, {frozenset(e) for e in nx.from_dict_of_lists(graph).edges()})
+
+    def test_diameter_and_eccentricity(self):
+        graph = create_mongolian_tent_graph(6)
+        vertices, indptr, indices = build_csr(graph)
+        self.assertEqual(csr_diameter(indptr, indices), nx.diameter(nx.from_dict_of_lists(graph)))
+        ecc, farthest = csr_eccentricity(indptr, indices, vertices.index('x'))
+        self.assertEqual(ecc, nx.eccentricity(nx.from_dict_of_lists(graph), 'x'))
+        self.assertEqual(nx.shortest_path_length(nx.from_dict_of_lists(graph), 'x', vertices[farthest]), ecc)
+
+    def test_parallel_diameter_matches_serial(self):
+        """Splitting fringe BFS over worker processes gives the same diameter"""
+        _vertices, indptr, indices = build_csr(create_mongolian_tent_graph(200))
+        self.assertEqual(csr_diameter(indptr, indices, max_workers=2), csr_diameter(indptr, indices))
+
+    def test_ifub_diameter_matches_all_pairs(self):
+        """iFUB agrees with the largest finite eccentricity, disconnected graphs included"""
+        for seed in range(40):
+            graph = nx.gnp_random_graph(5 + seed, 0.08 if seed % 2 else 0.3, seed=seed)
+            expected = max(
+                nx.diameter(graph.subgraph(component)) for component in nx.connected_components(graph)
+            )
+            _vertices, indptr, indices = build_csr(nx.to_dict_of_lists(graph))
+            self.assertEqual(csr_diameter(indptr, indices), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import sys
+import unittest
+from unittest import mock
+
+import src.edge_irregular_solver as edge_irregular_solver
+from src.edge_irregular_solver import k_labeling_backtracking, compute_used_weights, edge_irregular_lower_bound
+from src.csr_graph import build_csr
+from src.graph_generator import create_mongolian_tent_graph, generate_circulant_graph
+from src.labeling_solver import is_labeling_valid
+
+
+class TestEdgeIrregularSolver(unittest.TestCase):
+
+    def test_mongolian_tent_labelings_are_valid(self):
+        """Solver returns valid labelings with the known k for small tents"""
+        for n, expected_k in ((1, 2), (2, 6), (3, 8)):
+            with self.subTest(n=n):
+                graph = create_mongolian_tent_graph(n)
+                labeling = k_labeling_backtracking(graph)
+                self.assertIsNotNone(labeling)
+                self.assertEqual(max(labeling.values()), expected_k)
+                self.assertTrue(is_labeling_valid(graph, labeling))
+
+    def test_circulant_labeling_is_valid(self):
+        """Integer-keyed circulant graphs are supported"""
+        graph = generate_circulant_graph(8, 3)
+        labeling = k_labeling_backtracking(graph)
+        self.assertIsNotNone(labeling)
+        self.assertTrue(is_labeling_valid(graph, labeling))
+        self.assertEqual(sum(compute_used_weights(graph, labeling)), sum(map(len, graph.values())) // 2)
+
+    def test_used_weights_is_dense_map(self):
+        """compute_used_weights flags exactly the weights of labeled edges"""
+        graph = {"a": ["b", "c"], "b": ["a"], "c": ["a"]}
+        used = compute_used_weights(graph, {"a": 1, "b": 2, "c": 3})
+        self.assertEqual(used, bytearray([0, 0, 0, 1, 1, 0, 0]))
+        self.assertEqual(compute_used_weights(graph, {"a": 1}), bytearray(3))
+
+    def test_used_weights_with_precomputed_csr(self):
+        """Partial labelings only count edges with both endpoints labeled"""
+        graph = create_mongolian_tent_graph(4)
+        labels = {v: i + 1 for i, v in enumerate(graph) if i % 3}
+        expected = bytearray(2 * max(labels.values()) + 1)
+        for u in labels:
+            for v in graph[u]:
+                if v in labels:
+                    expected[labels[u] + labels[v]] = 1
+        self.assertEqual(compute_used_weights(graph, labels), expected)
+        self.assertEqual(compute_used_weights(graph, labels, build_csr(graph)), expected)
+
+    def test_pure_python_fallback_matches_jit(self):
+        """The list-based fallback finds the same labeling as the compiled kernel"""
+        graph = create_mongolian_tent_graph(3)
+        expected = k_labeling_backtracking(graph)
+        with mock.patch.object(edge_irregular_solver, "_backtrack_kernel_jit", None):
+            self.assertEqual(k_labeling_backtracking(graph), expected)
+
+    def test_compile_graph_orders_by_saturation_with_earlier_neighbors(self):
+        """Each position holds the most-constrained vertex and lists the neighbors placed before it"""
+        graph = create_mongolian_tent_graph(4)
+        ordering, pred_ptr, pred_idx = edge_irregular_solver._compile_graph(graph)
+
+        def constraint(u, placed):
+            return sum(w in placed for w in graph[u]), len(graph[u])
+
+        for i, v in enumerate(ordering):
+            placed = set(ordering[:i])
+            best = max(constraint(u, placed) for u in graph if u not in placed)
+            self.assertEqual(constraint(v, placed), best)
+        for i, v in enumerate(ordering):
+            preds = [ordering[j] for j in pred_idx[pred_ptr[i]:pred_ptr[i + 1]]]
+            self.assertEqual(preds, [u for u in graph[v] if ordering.index(u) < i])
+
+    @unittest.skipUnless(edge_irregular_solver.jit_kernel_available(), "numba not installed")
+    def test_kernel_compiled_at_import(self):
+        """The eager signature compiles the kernel before the first solve"""
+        self.assertEqual(len(edge_irregular_solver._backtrack_kernel_jit.signatures), 1)
+
+    def test_lower_bound_counts_edges(self):
+        """The k scan starts at ceil((|E| + 1) / 2) rather than the max degree"""
+        for n in (1, 3, 5):
+            with self.subTest(n=n):
+                graph = create_mongolian_tent_graph(n)
+                edge_count = sum(map(len, graph.values())) // 2
+                self.assertEqual(edge_irregular_lower_bound(graph), (edge_count + 2) // 2)
+        self.assertEqual(edge_irregular_lower_bound({}), 0)
+
+    def test_precomputed_lower_bound_is_reused(self):
+        """A caller-supplied lower bound skips recomputing it"""
+        graph = create_mongolian_tent_graph(3)
+        with mock.patch.object(edge_irregular_solver, "edge_irregular_lower_bound") as bound:
+            labeling = k_labeling_backtracking(graph, lower_bound=edge_irregular_lower_bound(graph))
+        bound.assert_not_called()
+        self.assertEqual(max(labeling.values()), 8)
+
+    def test_first_vertex_uses_lower_half_of_labels(self):
+        """Label reflection symmetry is broken at the first vertex of the ordering"""
+        graph = create_mongolian_tent_graph(3)
+        ordering, _pred_ptr, _pred_idx = edge_irregular_solver._compile_graph(graph)
+        labeling = k_labeling_backtracking(graph)
+        self.assertLessEqual(labeling[ordering[0]], (max(labeling.values()) + 1) // 2)
+
+    def test_search_deeper_than_recursion_limit(self):
+        """The explicit label stack handles more vertices than Python's recursion limit"""
+        depth = sys.getrecursionlimit() + 10
+        graph = {i: [] for i in range(depth)}
+        graph[0], graph[1] = [1], [0]
+        for fallback in (False, True):
+            kernel = None if fallback else edge_irregular_solver._backtrack_kernel_jit
+            with self.subTest(fallback=fallback), \
+                    mock.patch.object(edge_irregular_solver, "_backtrack_kernel_jit", kernel):
+                labeling = k_labeling_backtracking(graph)
+                self.assertEqual(len(labeling), depth)
+                self.assertTrue(is_labeling_valid(graph, labeling))
+
+    def test_k_limit_below_optimum_returns_none(self):
+        """No labeling exists when k_limit is below the optimum"""
+        self.assertIsNone(k_labeling_backtracking(create_mongolian_tent_graph(3), k_limit=7))
+
+    def test_parallel_scan_matches_serial(self):
+        """The speculative parallel k scan returns the same smallest k as the serial one"""
+        graph = create_mongolian_tent_graph(4)
+        serial = k_labeling_backtracking(graph, k_limit=16)
+        parallel = k_labeling_backtracking(graph, k_limit=16, max_workers=2)
+        self.assertEqual(max(parallel.values()), max(serial.values()))
+        self.assertTrue(is_labeling_valid(graph, parallel))
+
+
+if __name__ == '__main__':
+    unittest.main()
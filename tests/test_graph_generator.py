@@ -1,6 +1,8 @@
 import unittest
 import collections
-from src.graph_generator import generate_ladder_graph, create_mongolian_tent_graph
+import numpy as np
+from src.csr_graph import build_csr
+from src.graph_generator import generate_ladder_graph, create_mongolian_tent_graph, create_mongolian_tent_graph_csr
 
 class TestGraphGenerator(unittest.TestCase):
 
@@ -74,5 +76,24 @@ class TestGraphGenerator(unittest.TestCase):
         self.assertIn((1, 2), graph[(1, 1)]) # Horizontal
         self.assertIn((2, 1), graph[(1, 1)]) # Vertical
 
+    def test_create_mongolian_tent_graph_cached_copy_is_independent(self):
+        """Mutating a returned graph must not leak into later cached results"""
+        graph = create_mongolian_tent_graph(3)
+        graph['x'].append('bogus')
+        graph['extra'].append('x')
+        fresh = create_mongolian_tent_graph(3)
+        self.assertNotIn('bogus', fresh['x'])
+        self.assertNotIn('extra', fresh)
+
+    def test_tent_csr_matches_adjacency_list(self):
+        """Analytic CSR arrays equal the ones built from the adjacency list"""
+        for n in range(0, 12):
+            with self.subTest(n=n):
+                vertices, indptr, indices = build_csr(create_mongolian_tent_graph(n))
+                csr_indptr, csr_indices, id2vertex = create_mongolian_tent_graph_csr(n)
+                self.assertEqual(id2vertex, vertices)
+                np.testing.assert_array_equal(csr_indptr, indptr)
+                np.testing.assert_array_equal(csr_indices, indices)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
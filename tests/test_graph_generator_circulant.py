@@ -22,5 +22,16 @@ class TestCirculantGenerator(unittest.TestCase):
         total_edges = sum(len(v) for v in graph.values()) // 2
         self.assertEqual(total_edges, n * degree // 2)
 
+    def test_dropped_generators_absent(self):
+        """Every valid n keeps exactly the offsets 3..n/2-1 (never 1, 2 or n/2)."""
+        for n in range(6, 51, 2):
+            graph = generate_circulant_graph(n, 0)
+            expected = {s for s in range(3, n // 2)}
+            with self.subTest(n=n):
+                self.assertEqual(len(graph), n)
+                for i, neighbors in graph.items():
+                    self.assertEqual(len(neighbors), n - 6)
+                    self.assertEqual({min((j - i) % n, (i - j) % n) for j in neighbors}, expected)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
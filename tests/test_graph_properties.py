@@ -1,6 +1,11 @@
+import math
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
-from src.graph_properties import calculate_graph_metrics, calculate_lower_bound
-from src.graph_generator import generate_ladder_graph, create_mongolian_tent_graph
+from src.graph_properties import calculate_graph_metrics, calculate_lower_bound, chromatic_lb, compute_diameter, compute_diameter_persistent, graph_structure_key, is_circulant
+from src.graph_generator import generate_ladder_graph, create_mongolian_tent_graph, generate_circulant_graph
 
 class TestGraphProperties(unittest.TestCase):
 
@@ -27,6 +32,17 @@ class TestGraphProperties(unittest.TestCase):
         self.assertEqual(edge_count, 15)
         self.assertEqual(max_degree, 4)
 
+    def test_graph_metrics_of_adjacency_dict_skip_networkx(self):
+        """Adjacency dicts are measured without importing networkx"""
+        code = (
+            "import sys\n"
+            "from src.graph_properties import calculate_graph_metrics\n"
+            "assert calculate_graph_metrics({0: [1], 1: [0]}) == (1, 1)\n"
+            "assert 'networkx' not in sys.modules\n"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", code], cwd=repo_root, check=True)
+
     def test_calculate_lower_bound_n0(self):
         """Test lower bound calculation for n=0"""
         self.assertEqual(calculate_lower_bound(0), 0)
@@ -46,5 +62,79 @@ class TestGraphProperties(unittest.TestCase):
         # For MT_3,5: |E|=6*5-3=27, d=5. k >= max(ceil(28/2),5)=max(14,5)=14
         self.assertEqual(calculate_lower_bound(5), 14)
 
+    def test_chromatic_lb_star_graph(self):
+        """All leaves of a star share the centre, so they need distinct labels"""
+        star = {0: [1, 2, 3, 4], 1: [0], 2: [0], 3: [0], 4: [0]}
+        self.assertEqual(chromatic_lb(star), 4)
+        self.assertEqual(chromatic_lb({}), 0)
+
+    def test_chromatic_lb_never_exceeds_known_optimum(self):
+        """The clique bound stays below the known optimal k for small tents"""
+        for n, optimal_k in ((1, 2), (2, 6), (3, 8), (4, 11)):
+            with self.subTest(n=n):
+                self.assertLessEqual(chromatic_lb(create_mongolian_tent_graph(n)), optimal_k)
+
+    def test_graph_structure_key_ignores_insertion_order(self):
+        """Structure key depends only on the edge set"""
+        graph = create_mongolian_tent_graph(4)
+        reordered = {v: list(reversed(graph[v])) for v in reversed(list(graph))}
+        self.assertEqual(graph_structure_key(graph), graph_structure_key(reordered))
+        self.assertNotEqual(graph_structure_key(graph), graph_structure_key(create_mongolian_tent_graph(5)))
+
+    def test_compute_diameter_persistent_uses_disk_cache(self):
+        """Diameter is written once and then served from the cache directory"""
+        graph = create_mongolian_tent_graph(4)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.assertEqual(compute_diameter_persistent(graph, cache_dir), compute_diameter(graph))
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            self.assertEqual(compute_diameter_persistent(graph, cache_dir), compute_diameter(graph))
+
+    def test_diameter_estimate_skips_cache_write(self):
+        """Double-sweep estimates are not persisted"""
+        graph = create_mongolian_tent_graph(6)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.assertEqual(compute_diameter_persistent(graph, cache_dir, exact=False), compute_diameter(graph))
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_circulant_and_estimate_bypass_cache(self):
+        """Only the exact all-pairs path reads or writes the cache"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            circulant = generate_circulant_graph(12, 7)
+            self.assertEqual(compute_diameter_persistent(circulant, cache_dir), compute_diameter(circulant))
+            self.assertEqual(os.listdir(cache_dir), [])
+            tent = create_mongolian_tent_graph(4)
+            with open(os.path.join(cache_dir, f"{graph_structure_key(tent)}.json"), "w") as f:
+                f.write('{"diameter": 99}')
+            self.assertEqual(compute_diameter_persistent(tent, cache_dir, exact=False), compute_diameter(tent))
+            self.assertEqual(compute_diameter_persistent(tent, cache_dir), 99)
+
+    def test_lower_bound_closed_form_matches_built_graph(self):
+        """The closed-form bound equals the bound computed on the constructed tent"""
+        for n in range(1, 51):
+            tent = create_mongolian_tent_graph(n)
+            edges, max_degree = calculate_graph_metrics(tent)
+            expected = max(math.ceil((edges + 1) / 2), max_degree, chromatic_lb(tent))
+            with self.subTest(n=n):
+                self.assertEqual(calculate_lower_bound(n), expected)
+
+    def test_double_sweep_matches_exact_diameter(self):
+        """Fast diameter path is exact on Mongolian Tents and circulants"""
+        graphs = [create_mongolian_tent_graph(n) for n in range(1, 12)]
+        graphs += [generate_circulant_graph(n, max(n - 4, 2)) for n in range(5, 14)]
+        for graph in graphs:
+            with self.subTest(vertices=len(graph)):
+                self.assertEqual(compute_diameter(graph, exact=False), compute_diameter(graph))
+
+    def test_double_sweep_skips_isolated_start(self):
+        """An isolated minimum-degree vertex does not collapse the estimate to 0"""
+        graph = {'a': ['b'], 'b': ['a'], 'c': []}
+        self.assertEqual(compute_diameter(graph, exact=False), 1)
+        self.assertEqual(compute_diameter({'a': [], 'b': []}, exact=False), 0)
+
+    def test_is_circulant(self):
+        self.assertTrue(is_circulant(generate_circulant_graph(10, 4)))
+        self.assertFalse(is_circulant(create_mongolian_tent_graph(3)))
+        self.assertFalse(is_circulant({0: [1], 1: [0, 2], 2: [1]}))
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,95 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import main
+import src.json_output as json_output
+from src.json_output import dumps_indented, write_graph_json
+
+
+class TestWriteGraphJson(unittest.TestCase):
+
+    HEADER = {"graph_type": "mongolian_tent", "n": 2, "k_value": 6, "gap": "N/A", "time_taken_seconds": 0.25}
+    VERTICES = [{"id": [1, 1], "label": "v(1, 1)", "k_label": 1}, {"id": "x", "label": "vx", "k_label": 6}]
+    EDGES = [{"source": [1, 1], "target": "x", "weight": 7}]
+
+    def _round_trip(self, vertices, edges):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "out.json")
+            write_graph_json(path, self.HEADER, iter(vertices), iter(edges))
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+
+    def test_streamed_document_matches_dict(self):
+        """Streaming produces the same document as building the dict"""
+        expected = dict(self.HEADER, vertices=self.VERTICES, edges=self.EDGES)
+        self.assertEqual(self._round_trip(self.VERTICES, self.EDGES), expected)
+
+    def test_empty_sections(self):
+        """Empty vertex and edge iterables yield empty arrays"""
+        document = self._round_trip([], [])
+        self.assertEqual(document["vertices"], [])
+        self.assertEqual(document["edges"], [])
+
+    def test_stdlib_fallback(self):
+        """Output is identical when orjson is unavailable"""
+        expected = self._round_trip(self.VERTICES, self.EDGES)
+        with mock.patch.object(json_output, "_ORJSON_AVAILABLE", False):
+            self.assertEqual(self._round_trip(self.VERTICES, self.EDGES), expected)
+
+    def test_header_clashing_with_sections_rejected(self):
+        """A header key named like a section would be silently overwritten on load"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(ValueError):
+                write_graph_json(os.path.join(tmp_dir, "out.json"), {"edges": 8}, iter([]), iter([]))
+
+
+def _reject_duplicate_keys(pairs):
+    keys = [key for key, _value in pairs]
+    if len(keys) != len(set(keys)):
+        raise ValueError(f"duplicate keys: {keys}")
+    return dict(pairs)
+
+
+class TestMainJsonOutput(unittest.TestCase):
+
+    def test_circulant_counts_survive_round_trip(self):
+        """main --output-json writes vertex/edge counts without duplicate keys"""
+        argv = ["main.py", "--graph-type", "circulant", "--n", "8", "--solver", "heuristic",
+                "--heuristic_mode", "fast", "--output-json"]
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.makedirs(os.path.join(tmp_dir, "graphs"))
+            os.chdir(tmp_dir)
+            try:
+                with mock.patch("sys.argv", argv), mock.patch("src.visualization.visualize_k_labeling"), \
+                        contextlib.redirect_stdout(io.StringIO()):
+                    main.main()
+                (json_name,) = [f for f in os.listdir("graphs") if f.endswith(".json")]
+                with open(os.path.join("graphs", json_name), encoding="utf-8") as f:
+                    document = json.load(f, object_pairs_hook=_reject_duplicate_keys)
+            finally:
+                os.chdir(cwd)
+        self.assertEqual(document["vertex_count"], 8)
+        self.assertEqual(document["edge_count"], 8)
+        self.assertEqual(len(document["vertices"]), 8)
+        self.assertEqual(len(document["edges"]), 8)
+
+
+class TestDumpsIndented(unittest.TestCase):
+
+    def test_round_trip_and_unicode(self):
+        """Indented bytes parse back and keep non-ASCII characters unescaped"""
+        payload = {"is_valid": False, "warnings": ["Δ ≥ 4"], "stats": {"words": 10}}
+        encoded = dumps_indented(payload)
+        self.assertEqual(json.loads(encoded), payload)
+        self.assertIn("Δ".encode("utf-8"), encoded)
+        self.assertIn(b'\n  "warnings"', encoded)
+
+
+if __name__ == '__main__':
+    unittest.main()
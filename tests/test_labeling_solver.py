@@ -1,5 +1,9 @@
+import sys
 import unittest
-from src.labeling_solver import find_optimal_k_labeling, is_labeling_valid, greedy_k_labeling
+from unittest import mock
+
+from src import labeling_solver
+from src.labeling_solver import find_optimal_k_labeling, is_labeling_valid, greedy_k_labeling, dsatur_order, find_feasible_k_labeling
 from src.graph_generator import create_mongolian_tent_graph
 
 class TestLabelingSolver(unittest.TestCase):
@@ -50,6 +54,15 @@ class TestLabelingSolver(unittest.TestCase):
         }
         self.assertFalse(is_labeling_valid(graph, labeling))
 
+    def test_is_valid_assignment_with_label_bound(self):
+        """An explicit k_upper sizes the weight mask; the incremental check agrees"""
+        graph = create_mongolian_tent_graph(1)
+        labeling = {(1, 1): 1, (2, 1): 2, (3, 1): 2, 'x': 1}
+        self.assertTrue(is_labeling_valid(graph, labeling, k_upper=2))
+        self.assertTrue(is_labeling_valid(graph, labeling, last_vertex=(3, 1), k_upper=5))
+        labeling[(3, 1)] = 1
+        self.assertFalse(is_labeling_valid(graph, labeling, last_vertex=(3, 1), k_upper=2))
+
     def test_greedy_labeling_solver_n1(self):
         """Test the greedy solver for n=1"""
         graph = create_mongolian_tent_graph(1)
@@ -69,5 +82,212 @@ class TestLabelingSolver(unittest.TestCase):
             # Greedy heuristic did not find a labeling; this is acceptable for this test case
             self.assertIsNone(labeling)
 
+    def test_greedy_solvers_report_original_vertex_keys(self):
+        """Dense label arrays are mapped back to the graph's own vertex keys"""
+        graph = create_mongolian_tent_graph(4)
+        labeling = labeling_solver._first_fit_greedy_k_labeling(graph, 60)
+        self.assertEqual(set(labeling), set(graph))
+        self.assertTrue(all(label >= 1 for label in labeling.values()))
+        self.assertTrue(is_labeling_valid(graph, labeling))
+
+        failure_counts = dict.fromkeys(graph, 0)
+        greedy_k_labeling(graph, 2, attempts=2, failure_counts=failure_counts)
+        self.assertEqual(set(failure_counts), set(graph))
+        self.assertEqual(sum(failure_counts.values()), 2)
+
+    def test_conflict_score_matches_direct_count(self):
+        """The bitmask score counts the choices each unassigned neighbor loses"""
+        k = 7
+        used_weights = [False] * (2 * k + 1)
+        used = 0
+        for weight in (3, 4, 9, 12, 14):
+            used_weights[weight] = True
+            used |= 1 << weight
+        for label in range(1, k + 1):
+            lost = sum(used_weights[label + m] for m in range(1, k + 1))
+            self.assertEqual(labeling_solver._calculate_conflict_score(label, 3, used, k), 3 * lost)
+            self.assertEqual(labeling_solver._calculate_conflict_score(label, 0, used, k), 0)
+
+    def test_parallel_greedy_attempts_return_valid_labeling(self):
+        """Attempts spread over worker processes still return a valid labeling"""
+        graph = create_mongolian_tent_graph(5)
+        labeling = greedy_k_labeling(graph, 40, attempts=8, max_workers=2)
+        self.assertIsNotNone(labeling)
+        self.assertEqual(set(labeling), set(graph))
+        self.assertTrue(is_labeling_valid(graph, labeling))
+        self.assertIsNone(greedy_k_labeling(graph, 2, attempts=8, max_workers=2))
+
+    def test_heuristics_reject_neighbors_with_equal_labels(self):
+        """Two labeled neighbors sharing a label repeat a weight, so no heuristic completes such a labeling"""
+        graph = create_mongolian_tent_graph(50)
+        vertex_list = list(graph)
+        vertex_ids = {v: i for i, v in enumerate(vertex_list)}
+        neighbor_ids = [[vertex_ids[w] for w in graph[v]] for v in vertex_list]
+        rng = labeling_solver.random.Random(7)
+        for _ in range(5):
+            labels, _failed = labeling_solver._greedy_attempt(neighbor_ids, list(range(len(vertex_list))), 600, 3, rng)
+            if labels is not None:
+                self.assertTrue(is_labeling_valid(graph, dict(zip(vertex_list, labels))))
+        for k in (300, 1000):
+            for on_step in (None, lambda event: None):
+                labeling = labeling_solver._first_fit_greedy_k_labeling(graph, k, on_step=on_step)
+                if labeling is not None:
+                    self.assertTrue(is_labeling_valid(graph, labeling))
+
+    def test_intelligent_search_starts_one_pool_for_all_k(self):
+        """The parallel k search reuses one worker pool instead of starting one per k"""
+        graph = create_mongolian_tent_graph(4)
+        with mock.patch.object(labeling_solver, "_greedy_pool", wraps=labeling_solver._greedy_pool) as pool:
+            k, labeling = find_feasible_k_labeling(
+                "mongolian_tent", {"n": 4}, num_attempts=8, algorithm="intelligent", max_workers=2
+            )
+        self.assertIsNotNone(labeling)
+        self.assertTrue(is_labeling_valid(graph, labeling))
+        pool.assert_called_once()
+
+    def test_first_fit_mask_path_matches_animated_path(self):
+        """The bitmask first fit picks the same labels as the event-emitting loop"""
+        graph = create_mongolian_tent_graph(6)
+        for k in (8, 17, 25, 40):
+            with self.subTest(k=k):
+                animated = labeling_solver._first_fit_greedy_k_labeling(graph, k, on_step=lambda event: None)
+                self.assertEqual(labeling_solver._first_fit_greedy_k_labeling(graph, k), animated)
+
+    def test_resumed_first_fit_matches_fresh_pass(self):
+        """A first fit resumed from a failed pass at a smaller k labels like a fresh pass"""
+        graph = create_mongolian_tent_graph(4)
+        order = labeling_solver._first_fit_vertex_order(graph, "mongolian_tent")
+        state = {}
+        for k in range(5, 30):
+            resumed = labeling_solver._first_fit_greedy_k_labeling(graph, k, vertex_order=order, resume_state=state)
+            with self.subTest(k=k):
+                self.assertEqual(resumed, labeling_solver._first_fit_greedy_k_labeling(graph, k, vertex_order=order))
+            if resumed is not None:
+                break
+        self.assertIsNotNone(resumed)
+        self.assertGreater(k, 5)
+        self.assertTrue(is_labeling_valid(graph, resumed))
+
+    def test_fast_search_sorts_first_fit_order_once(self):
+        """The fast k search computes the degree order once and reuses it for every k"""
+        with mock.patch.object(labeling_solver, "_first_fit_vertex_order",
+                               wraps=labeling_solver._first_fit_vertex_order) as order, \
+                mock.patch.object(labeling_solver, "_first_fit_greedy_k_labeling",
+                                  wraps=labeling_solver._first_fit_greedy_k_labeling) as first_fit, \
+                mock.patch.object(labeling_solver, "greedy_k_labeling", return_value=None):
+            find_feasible_k_labeling("mongolian_tent", {"n": 6}, max_k_multiplier=2, algorithm="fast")
+        self.assertGreater(first_fit.call_count, 1)
+        order.assert_called_once()
+
+    def test_dsatur_order_is_permutation_starting_at_max_degree(self):
+        """DSatur order visits every vertex once, starting from a maximum-degree vertex"""
+        graph = create_mongolian_tent_graph(4)
+        order = dsatur_order(graph)
+        self.assertCountEqual(order, list(graph))
+        self.assertEqual(len(graph[order[0]]), max(len(v) for v in graph.values()))
+        # Every later vertex touches the already-ordered prefix (the graph is connected)
+        for i in range(1, len(order)):
+            self.assertTrue(any(u in graph[order[i]] for u in order[:i]))
+
+    def test_intelligent_heuristic_uses_vertex_order(self):
+        """The intelligent heuristic accepts a precomputed order and returns a valid labeling"""
+        graph = create_mongolian_tent_graph(3)
+        k, labeling = find_feasible_k_labeling(
+            "mongolian_tent", {"n": 3}, algorithm="intelligent", vertex_order=dsatur_order(graph)
+        )
+        self.assertIsNotNone(labeling)
+        self.assertTrue(is_labeling_valid(graph, labeling))
+
+    def test_backtracking_rejects_equal_labels_on_common_neighbor(self):
+        """Two labeled neighbors with equal labels collide at the vertex joining them"""
+        graph = {'a': ['c'], 'b': ['c'], 'c': ['a', 'b']}
+        events = []
+        labeling = labeling_solver._backtrack_k_labeling_generic(
+            graph, 2, {}, ['a', 'b', 'c'], 0, on_step=events.append
+        )
+        self.assertEqual(labeling, {'a': 1, 'b': 2, 'c': 1})
+        self.assertTrue(is_labeling_valid(graph, labeling))
+        self.assertEqual(events[0].data, {"vertex": 'a', "label": 1})
+
+    def test_backtracking_counts_preassigned_neighbors(self):
+        """Preassigned vertices constrain the vertices ordered after them"""
+        graph = {'a': ['b'], 'b': ['a', 'c'], 'c': ['b']}
+        labeling = labeling_solver._backtrack_k_labeling_generic(graph, 2, {'a': 1}, ['c', 'b'], 0)
+        self.assertEqual(labeling, {'a': 1, 'c': 2, 'b': 1})
+        self.assertTrue(is_labeling_valid(graph, labeling))
+
+    def test_backtracking_deeper_than_recursion_limit(self):
+        """The explicit-stack search labels more vertices than Python's recursion limit"""
+        graph = create_mongolian_tent_graph(400)
+        self.assertGreater(len(graph), sys.getrecursionlimit())
+        labeling = labeling_solver._backtrack_k_labeling_generic(
+            graph, 4000, {}, dsatur_order(graph), 0, on_step=lambda event: None
+        )
+        self.assertIsNotNone(labeling)
+        self.assertTrue(is_labeling_valid(graph, labeling))
+
+    def test_first_vertex_tries_only_lower_half_of_labels(self):
+        """Reflection symmetry bounds the first vertex to labels 1..(k+1)//2 on an empty labeling"""
+        from src.events import EventType
+        graph = create_mongolian_tent_graph(2)
+        order = dsatur_order(graph)
+        events = []
+        labeling = labeling_solver._backtrack_k_labeling_generic(graph, 5, {}, order, 0, on_step=events.append)
+        self.assertIsNone(labeling)
+        first_labels = {
+            e.data["label"] for e in events
+            if e.type == EventType.VERTEX_LABELED and e.data["vertex"] == order[0]
+        }
+        self.assertEqual(first_labels, {1, 2, 3})
+
+    def test_least_feasible_k_gallops_then_bisects(self):
+        """The k search finds the first feasible k with a logarithmic number of probes"""
+        for lower_bound, optimum in ((5, 5), (5, 6), (3, 40), (10, 1000)):
+            probes = []
+
+            def solve(k):
+                probes.append(k)
+                return {"k": k} if k >= optimum else None
+
+            with self.subTest(lower_bound=lower_bound, optimum=optimum):
+                self.assertEqual(labeling_solver._least_feasible_k(solve, lower_bound), (optimum, {"k": optimum}))
+                self.assertLessEqual(len(probes), 2 * (optimum - lower_bound + 1).bit_length() + 1)
+
+    def test_circulant_search_starts_at_graph_bound(self):
+        """The exact circulant search starts at the generated graph's counting bound, not the closed form"""
+        probed = []
+        solve = labeling_solver._backtrack_k_labeling_generic
+
+        def recording(adjacency_list, k, *args):
+            probed.append(k)
+            return solve(adjacency_list, k, *args)
+
+        with mock.patch.object(labeling_solver, "_backtrack_k_labeling_generic", side_effect=recording):
+            k, labeling = labeling_solver.find_optimal_k_labeling_circulant(10, 1)
+        self.assertEqual(k, 12)
+        self.assertEqual(probed[0], 11)
+
+    def test_optimal_search_same_with_and_without_jit(self):
+        """Without a callback the search runs in the Numba kernel; the Python path finds the same k"""
+        from src import edge_irregular_solver
+        graph = create_mongolian_tent_graph(3)
+        for kernel in (edge_irregular_solver._backtrack_kernel_jit, None):
+            with self.subTest(jit=kernel is not None), \
+                    mock.patch.object(edge_irregular_solver, "_backtrack_kernel_jit", kernel):
+                k, labeling = find_optimal_k_labeling("mongolian_tent", {"n": 3})
+                self.assertEqual(k, 8)
+                self.assertTrue(is_labeling_valid(graph, labeling))
+
+    def test_repeated_solves_share_one_graph(self):
+        """The tent adjacency is built once per size and cannot be mutated by a solver"""
+        labeling_solver._cached_tent_graph.cache_clear()
+        with mock.patch.object(labeling_solver, "create_mongolian_tent_graph", wraps=create_mongolian_tent_graph) as build:
+            first = find_optimal_k_labeling("mongolian_tent", {"n": 2})
+            second = find_optimal_k_labeling("mongolian_tent", {"n": 2})
+        build.assert_called_once_with(2)
+        self.assertEqual(first, second)
+        with self.assertRaises(TypeError):
+            labeling_solver._cached_tent_graph(2)[(1, 1)] = ()
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file